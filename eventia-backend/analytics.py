@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
 
 # Import our database connection
@@ -19,33 +19,32 @@ router = APIRouter(
 
 @router.get("/", response_model=Dict[str, Any])
 async def get_analytics(
-    db: MongoClient = Depends(get_db),
+    db: AsyncIOMotorDatabase = Depends(get_db),
     _: bool = Depends(verify_admin_token)
 ):
     """Get admin analytics dashboard data (admin only)"""
     # Get total bookings
-    total_bookings = db.bookings.count_documents({})
+    total_bookings = await db.bookings.count_documents({})
     
     # Get bookings with various statuses
-    pending_bookings = db.bookings.count_documents({"status": "pending"})
-    confirmed_bookings = db.bookings.count_documents({"status": "confirmed"})
-    dispatched_bookings = db.bookings.count_documents({"status": "dispatched"})
+    pending_bookings = await db.bookings.count_documents({"status": "pending"})
+    confirmed_bookings = await db.bookings.count_documents({"status": "confirmed"})
+    dispatched_bookings = await db.bookings.count_documents({"status": "dispatched"})
     
     # Get payment statuses
-    pending_payments = db.bookings.count_documents({"payment_status": "pending"})
-    pending_verification = db.bookings.count_documents({"payment_status": "pending_verification"})
-    completed_payments = db.bookings.count_documents({"payment_status": "completed"})
+    pending_payments = await db.bookings.count_documents({"payment_status": "pending"})
+    pending_verification = await db.bookings.count_documents({"payment_status": "pending_verification"})
+    completed_payments = await db.bookings.count_documents({"payment_status": "completed"})
     
     # Calculate total revenue
     revenue_pipeline = [
         {"$match": {"payment_status": "completed"}},
         {"$group": {"_id": None, "total": {"$sum": "$total_amount"}}}
     ]
-    revenue_result = list(db.bookings.aggregate(revenue_pipeline))
+    revenue_result = await db.bookings.aggregate(revenue_pipeline).to_list(length=None)
     total_revenue = revenue_result[0]["total"] if revenue_result else 0
     
-    # Get revenue by date (last 30 days)
-    thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+    # Get revenue by date
     revenue_by_date_pipeline = [
         {"$match": {"payment_status": "completed"}},
         {"$group": {
@@ -54,7 +53,7 @@ async def get_analytics(
         }},
         {"$sort": {"_id": 1}}
     ]
-    revenue_by_date = list(db.bookings.aggregate(revenue_by_date_pipeline))
+    revenue_by_date = await db.bookings.aggregate(revenue_by_date_pipeline).to_list(length=None)
     
     # Get event popularity
     event_popularity_pipeline = [
@@ -65,13 +64,13 @@ async def get_analytics(
         {"$sort": {"ticket_count": -1}},
         {"$limit": 10}
     ]
-    popular_events_raw = list(db.bookings.aggregate(event_popularity_pipeline))
+    popular_events_raw = await db.bookings.aggregate(event_popularity_pipeline).to_list(length=None)
     
     # Get event details for popular events
     popular_events = []
     for event in popular_events_raw:
         try:
-            event_details = db.events.find_one({"_id": ObjectId(event["_id"])})
+            event_details = await db.events.find_one({"_id": ObjectId(event["_id"])})
             if event_details:
                 popular_events.append({
                     "event_id": str(event["_id"]),
@@ -94,7 +93,7 @@ async def get_analytics(
         }},
         {"$sort": {"date": 1}}
     ]
-    user_activity = list(db.bookings.aggregate(user_activity_pipeline))
+    user_activity = await db.bookings.aggregate(user_activity_pipeline).to_list(length=None)
     
     return {
         "summary": {
@@ -117,15 +116,14 @@ async def get_analytics(
 @router.get("/revenue", response_model=Dict[str, Any])
 async def get_revenue_analytics(
     days: int = 30,
-    db: MongoClient = Depends(get_db),
+    db: AsyncIOMotorDatabase = Depends(get_db),
     _: bool = Depends(verify_admin_token)
 ):
     """Get detailed revenue analytics for a specific period (admin only)"""
-    # Calculate the date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
+    # Calculate the start of the period in UTC so results don't depend on server timezone
+    start_date = datetime.now(timezone.utc) - timedelta(days=days)
     
-    # Format dates for query
+    # booking_date is stored as an ISO string, so compare against the date prefix
     start_date_str = start_date.strftime("%Y-%m-%d")
     
     # Pipeline for daily revenue
@@ -141,7 +139,7 @@ async def get_revenue_analytics(
         }},
         {"$sort": {"_id": 1}}
     ]
-    daily_revenue = list(db.bookings.aggregate(daily_revenue_pipeline))
+    daily_revenue = await db.bookings.aggregate(daily_revenue_pipeline).to_list(length=None)
     
     # Pipeline for revenue by category
     category_revenue_pipeline = [
@@ -166,7 +164,7 @@ async def get_revenue_analytics(
     
     # Try to run the category pipeline, but handle potential issues with ObjectId conversion
     try:
-        category_revenue = list(db.bookings.aggregate(category_revenue_pipeline))
+        category_revenue = await db.bookings.aggregate(category_revenue_pipeline).to_list(length=None)
     except:
         # Fallback to a simpler query if the lookup fails
         category_revenue = []
@@ -180,7 +178,7 @@ async def get_revenue_analytics(
 @router.get("/events-performance", response_model=Dict[str, Any])
 async def get_events_performance(
     limit: int = 10,
-    db: MongoClient = Depends(get_db),
+    db: AsyncIOMotorDatabase = Depends(get_db),
     _: bool = Depends(verify_admin_token)
 ):
     """Get performance analytics for events (admin only)"""
@@ -194,13 +192,13 @@ async def get_events_performance(
         {"$sort": {"ticket_count": -1}},
         {"$limit": limit}
     ]
-    top_events_raw = list(db.bookings.aggregate(top_events_pipeline))
+    top_events_raw = await db.bookings.aggregate(top_events_pipeline).to_list(length=None)
     
     # Get event details for each top event
     top_events = []
     for event in top_events_raw:
         try:
-            event_details = db.events.find_one({"_id": ObjectId(event["_id"])})
+            event_details = await db.events.find_one({"_id": ObjectId(event["_id"])})
             if event_details:
                 top_events.append({
                     "event_id": str(event["_id"]),
@@ -216,7 +214,7 @@ async def get_events_performance(
             continue
     
     # Calculate sell-through rate for each event
-    events_with_availability = list(db.events.find({}, {"name": 1, "availability": 1}))
+    events_with_availability = await db.events.find({}, {"name": 1, "availability": 1}).to_list(length=None)
     sell_through_rates = []
     
     for event in events_with_availability:
@@ -228,7 +226,7 @@ async def get_events_performance(
             {"$match": {"event_id": str(event["_id"])}},
             {"$group": {"_id": None, "total_sold": {"$sum": "$quantity"}}}
         ]
-        tickets_sold_result = list(db.bookings.aggregate(tickets_sold_pipeline))
+        tickets_sold_result = await db.bookings.aggregate(tickets_sold_pipeline).to_list(length=None)
         tickets_sold = tickets_sold_result[0]["total_sold"] if tickets_sold_result else 0
         
         # Calculate total capacity and sell-through rate
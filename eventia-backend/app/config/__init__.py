@@ -4,7 +4,7 @@ Config Package Initialization
 This package contains configuration modules.
 """
 
-from app.config.settings import Settings, settings
+from app.config.settings import Settings, settings, get_settings
 
 from app.config.constants import (
     BookingStatus,
@@ -18,6 +18,7 @@ from app.config.constants import (
 __all__ = [
     'Settings',
     'settings',
+    'get_settings',
     'BookingStatus',
     'EventStatus',
     'EventCategory',
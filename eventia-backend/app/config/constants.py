@@ -11,10 +11,14 @@ class BookingStatus:
     EXPIRED = 'expired'
     CANCELLED = 'cancelled'
     
+    # Built once at class creation (likewise below); use VALUES_SET for membership checks
+    VALUES = (PENDING, CONFIRMED, EXPIRED, CANCELLED)
+    VALUES_SET = frozenset(VALUES)
+    
     @classmethod
     def values(cls):
         """Get all booking status values."""
-        return [cls.PENDING, cls.CONFIRMED, cls.EXPIRED, cls.CANCELLED]
+        return cls.VALUES
 
 # Event status constants
 class EventStatus:
@@ -23,10 +27,13 @@ class EventStatus:
     CANCELLED = 'cancelled'
     DRAFT = 'draft'
     
+    VALUES = (AVAILABLE, SOLDOUT, CANCELLED, DRAFT)
+    VALUES_SET = frozenset(VALUES)
+    
     @classmethod
     def values(cls):
         """Get all event status values."""
-        return [cls.AVAILABLE, cls.SOLDOUT, cls.CANCELLED, cls.DRAFT]
+        return cls.VALUES
 
 # Event category constants
 class EventCategory:
@@ -40,34 +47,43 @@ class EventCategory:
     CONFERENCE = 'conference'
     OTHER = 'other'
     
+    VALUES = (
+        CRICKET, FOOTBALL, CONCERT, THEATRE,
+        MOVIE, EXHIBITION, WORKSHOP, CONFERENCE,
+        OTHER
+    )
+    VALUES_SET = frozenset(VALUES)
+    
     @classmethod
     def values(cls):
         """Get all event category values."""
-        return [
-            cls.CRICKET, cls.FOOTBALL, cls.CONCERT, cls.THEATRE,
-            cls.MOVIE, cls.EXHIBITION, cls.WORKSHOP, cls.CONFERENCE,
-            cls.OTHER
-        ]
+        return cls.VALUES
 
 # Payment mode constants
 class PaymentMode:
     VPA = 'vpa'
     QR = 'qr'
     
+    VALUES = (VPA, QR)
+    VALUES_SET = frozenset(VALUES)
+    
     @classmethod
     def values(cls):
         """Get all payment mode values."""
-        return [cls.VPA, cls.QR]
+        return cls.VALUES
 
 # API response status constants
 class APIStatus:
     SUCCESS = 'success'
     ERROR = 'error'
     
+    VALUES = (SUCCESS, ERROR)
+    VALUES_SET = frozenset(VALUES)
+    
     @classmethod
     def values(cls):
         """Get all API status values."""
-        return [cls.SUCCESS, cls.ERROR]
+        return cls.VALUES
 
 # API response message constants
 class APIMessage:
@@ -7,6 +7,7 @@ configuration from .env file or env vars
 """
 
 import os
+from functools import lru_cache
 from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -54,11 +55,19 @@ class Settings(BaseSettings):
     # Use local MongoDB instance to avoid SSL issues
     MONGODB_URL: Optional[str] = "mongodb://localhost:27017/eventia"
     MONGODB_DB: str = "eventia"
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 10
+    MONGODB_MAX_IDLE_TIME_MS: int = 300000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 10000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
 
     # For backward compatibility
     MONGO_URI: Optional[str] = None
     DATABASE_NAME: Optional[str] = None
 
+    # Redis for sharing WebSocket broadcasts between workers (optional)
+    REDIS_URL: Optional[str] = None
+
     # JWT Authentication
     JWT_SECRET_KEY: str = "supersecretkey123"
     JWT_ALGORITHM: str = "HS256"
@@ -117,5 +126,11 @@ class Settings(BaseSettings):
         if self.DATABASE_NAME is None:
             self.DATABASE_NAME = self.MONGODB_DB
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading the environment only once"""
+    return Settings()
+
+
 # instantiate settings for use throughout the app
-settings = Settings()
+settings = get_settings()
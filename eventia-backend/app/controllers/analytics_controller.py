@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from bson import ObjectId
-from datetime import datetime, timedelta
+from bson.errors import InvalidId
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
 
 from ..db.mongodb import engine
@@ -16,88 +17,113 @@ router = APIRouter(
 
 async def get_analytics():
     """Get admin analytics dashboard data (admin only)"""
-    # Get total bookings
-    total_bookings = await engine.count(Booking)
+    # Get booking counts, revenue totals, trends and popularity in a single
+    # round trip; each $facet branch shares the one pass over bookings
+    summary_pipeline = [
+        {
+            "$facet": {
+                "totals": [
+                    {
+                        "$group": {
+                            "_id": None,
+                            "total_bookings": {"$sum": 1},
+                            "total_revenue": {
+                                "$sum": {
+                                    "$cond": [
+                                        {"$eq": ["$payment_status", "completed"]},
+                                        "$total_amount",
+                                        0,
+                                    ]
+                                }
+                            },
+                        }
+                    }
+                ],
+                "by_payment_status": [
+                    {"$group": {"_id": "$payment_status", "count": {"$sum": 1}}}
+                ],
+                # Revenue by date
+                "revenue_by_date": [
+                    {"$match": {"payment_status": "completed"}},
+                    {
+                        "$group": {
+                            "_id": {"$substr": ["$booking_date", 0, 10]},
+                            "daily_revenue": {"$sum": "$total_amount"},
+                        }
+                    },
+                    {"$sort": {"_id": 1}},
+                ],
+                # Event popularity
+                "popular_events": [
+                    {"$group": {"_id": "$event_id", "ticket_count": {"$sum": "$quantity"}}},
+                    {"$sort": {"ticket_count": -1}},
+                    {"$limit": 10},
+                ],
+                # User activity data (unique users by day)
+                "user_activity": [
+                    {
+                        "$group": {
+                            "_id": {"$substr": ["$booking_date", 0, 10]},
+                            "unique_users": {"$addToSet": "$address.email"},
+                        }
+                    },
+                    {
+                        "$project": {"date": "$_id", "count": {"$size": "$unique_users"}}
+                    },
+                    {"$sort": {"date": 1}},
+                ],
+            }
+        }
+    ]
+    summary_result = await engine.aggregate(Booking, summary_pipeline)
+    summary = summary_result[0] if summary_result else {}
+    totals = summary.get("totals") or [{}]
+    status_counts = {
+        row["_id"]: row["count"] for row in summary.get("by_payment_status", [])
+    }
+
+    total_bookings = totals[0].get("total_bookings", 0)
+    total_revenue = totals[0].get("total_revenue", 0)
 
     # Get bookings with various statuses
-    pending_bookings = await engine.count(Booking, Booking.payment_status == "pending")
-    confirmed_bookings = await engine.count(
-        Booking, Booking.payment_status == "confirmed"
-    )
-    dispatched_bookings = await engine.count(
-        Booking, Booking.payment_status == "dispatched"
-    )
+    pending_bookings = status_counts.get("pending", 0)
+    confirmed_bookings = status_counts.get("confirmed", 0)
+    dispatched_bookings = status_counts.get("dispatched", 0)
 
     # Get payment statuses
-    pending_payments = await engine.count(Booking, Booking.payment_status == "pending")
-    pending_verification = await engine.count(
-        Booking, Booking.payment_status == "pending_verification"
-    )
-    completed_payments = await engine.count(
-        Booking, Booking.payment_status == "completed"
-    )
+    pending_payments = status_counts.get("pending", 0)
+    pending_verification = status_counts.get("pending_verification", 0)
+    completed_payments = status_counts.get("completed", 0)
 
-    # Calculate total revenue
-    revenue_pipeline = [
-        {"$match": {"payment_status": "completed"}},
-        {"$group": {"_id": None, "total": {"$sum": "$total_amount"}}},
-    ]
-    revenue_result = await engine.aggregate(Booking, revenue_pipeline)
-    total_revenue = revenue_result[0]["total"] if revenue_result else 0
+    revenue_by_date = summary.get("revenue_by_date", [])
+    popular_events_raw = summary.get("popular_events", [])
 
-    # Get revenue by date (last 30 days)
-    thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-    revenue_by_date_pipeline = [
-        {"$match": {"payment_status": "completed"}},
-        {
-            "$group": {
-                "_id": {"$substr": ["$booking_date", 0, 10]},
-                "daily_revenue": {"$sum": "$total_amount"},
-            }
-        },
-        {"$sort": {"_id": 1}},
-    ]
-    revenue_by_date = await engine.aggregate(Booking, revenue_by_date_pipeline)
-
-    # Get event popularity
-    event_popularity_pipeline = [
-        {"$group": {"_id": "$event_id", "ticket_count": {"$sum": "$quantity"}}},
-        {"$sort": {"ticket_count": -1}},
-        {"$limit": 10},
-    ]
-    popular_events_raw = await engine.aggregate(Booking, event_popularity_pipeline)
-
-    # Get event details for popular events
-    popular_events = []
+    # Get event details for popular events in a single query
+    popular_event_ids = []
     for event in popular_events_raw:
         try:
-            event_details = await engine.find_one(Event, Event.id == ObjectId(event["_id"]))
-            if event_details:
-                popular_events.append(
-                    {
-                        "event_id": str(event["_id"]),
-                        "event_name": event_details.title,
-                        "ticket_count": event["ticket_count"],
-                    }
-                )
-        except:
-            # Skip if event ID is invalid or event not found
+            popular_event_ids.append(ObjectId(event["_id"]))
+        except (InvalidId, TypeError):
+            # Skip if event ID is invalid
             continue
+    popular_details_by_id = {
+        str(event_details.id): event_details
+        for event_details in await engine.find(Event, {"_id": {"$in": popular_event_ids}})
+    }
 
-    # Get user activity data (unique users by day)
-    user_activity_pipeline = [
-        {
-            "$group": {
-                "_id": {"$substr": ["$booking_date", 0, 10]},
-                "unique_users": {"$addToSet": "$address.email"},
-            }
-        },
-        {
-            "$project": {"date": "$_id", "count": {"$size": "$unique_users"}}
-        },
-        {"$sort": {"date": 1}},
-    ]
-    user_activity = await engine.aggregate(Booking, user_activity_pipeline)
+    popular_events = []
+    for event in popular_events_raw:
+        event_details = popular_details_by_id.get(str(event["_id"]))
+        if event_details:
+            popular_events.append(
+                {
+                    "event_id": str(event["_id"]),
+                    "event_name": event_details.title,
+                    "ticket_count": event["ticket_count"],
+                }
+            )
+
+    user_activity = summary.get("user_activity", [])
 
     return {
         "summary": {
@@ -120,11 +146,10 @@ async def get_analytics():
 
 async def get_revenue_analytics(days: int = 30):
     """Get detailed revenue analytics for a specific period (admin only)"""
-    # Calculate the date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
+    # Calculate the start of the period in UTC so results don't depend on server timezone
+    start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Format dates for query
+    # booking_date is stored as an ISO string, so compare against the date prefix
     start_date_str = start_date.strftime("%Y-%m-%d")
 
     # Pipeline for daily revenue
@@ -203,42 +228,54 @@ async def get_events_performance(limit: int = 10):
     ]
     top_events_raw = await engine.aggregate(Booking, top_events_pipeline)
 
-    # Get event details for each top event
-    top_events = []
+    # Load details for all top events in one query instead of one per event
+    top_event_ids = []
     for event in top_events_raw:
         try:
-            event_details = await engine.find_one(Event, Event.id == ObjectId(event["_id"]))
-            if event_details:
-                top_events.append(
-                    {
-                        "event_id": str(event["_id"]),
-                        "event_name": event_details.title,
-                        "ticket_count": event["ticket_count"],
-                        "revenue": event["revenue"],
-                        "category": event_details.category if hasattr(event_details, 'category') else "Unknown",
-                        "venue": event_details.venue if hasattr(event_details, 'venue') else "Unknown",
-                        "date": event_details.date if hasattr(event_details, 'date') else "Unknown",
-                    }
-                )
-        except:
-            # Skip if event ID is invalid or event not found
+            top_event_ids.append(ObjectId(event["_id"]))
+        except (InvalidId, TypeError):
+            # Skip if event ID is invalid
             continue
+    event_details_by_id = {
+        str(event_details.id): event_details
+        for event_details in await engine.find(Event, {"_id": {"$in": top_event_ids}})
+    }
+
+    top_events = []
+    for event in top_events_raw:
+        event_details = event_details_by_id.get(str(event["_id"]))
+        if event_details:
+            top_events.append(
+                {
+                    "event_id": str(event["_id"]),
+                    "event_name": event_details.title,
+                    "ticket_count": event["ticket_count"],
+                    "revenue": event["revenue"],
+                    "category": event_details.category if hasattr(event_details, 'category') else "Unknown",
+                    "venue": event_details.venue if hasattr(event_details, 'venue') else "Unknown",
+                    "date": event_details.date if hasattr(event_details, 'date') else "Unknown",
+                }
+            )
 
     # Calculate sell-through rate for each event
     events_with_availability = await engine.find(Event)
     sell_through_rates = []
 
+    # Get tickets sold for all events in one aggregation rather than one per event
+    event_ids = [str(event.id) for event in events_with_availability]
+    tickets_sold_pipeline = [
+        {"$match": {"event_id": {"$in": event_ids}}},
+        {"$group": {"_id": "$event_id", "total_sold": {"$sum": "$quantity"}}},
+    ]
+    tickets_sold_by_event = {
+        row["_id"]: row["total_sold"]
+        for row in await engine.aggregate(Booking, tickets_sold_pipeline)
+    }
+
     for event in events_with_availability:
         # Get original capacity (current availability + tickets sold)
         original_capacity = event.availability if hasattr(event, 'availability') else 0
-
-        # Get tickets sold
-        tickets_sold_pipeline = [
-            {"$match": {"event_id": str(event.id)}},
-            {"$group": {"_id": None, "total_sold": {"$sum": "$quantity"}}},
-        ]
-        tickets_sold_result = await engine.aggregate(Booking, tickets_sold_pipeline)
-        tickets_sold = tickets_sold_result[0]["total_sold"] if tickets_sold_result else 0
+        tickets_sold = tickets_sold_by_event.get(str(event.id), 0)
 
         # Calculate total capacity and sell-through rate
         total_capacity = original_capacity + tickets_sold
@@ -5,7 +5,9 @@ Functions for user authentication, token management, and account operations
 """
 
 import datetime
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from bson.objectid import ObjectId
 import jwt
 from passlib.context import CryptContext
@@ -93,6 +95,7 @@ async def create_user(user_data: UserCreate) -> UserResponse:
     
     # Create new user
     hashed_password = get_password_hash(user_data.password)
+    now = datetime.datetime.utcnow()
     
     new_user = UserInDB(
         email=user_data.email,
@@ -100,8 +103,8 @@ async def create_user(user_data: UserCreate) -> UserResponse:
         full_name=user_data.full_name,
         is_active=True,
         is_admin=False,
-        created_at=datetime.datetime.utcnow(),
-        updated_at=datetime.datetime.utcnow()
+        created_at=now,
+        updated_at=now
     )
     
     users_collection = await get_users_collection()
@@ -118,6 +121,28 @@ async def create_user(user_data: UserCreate) -> UserResponse:
     )
 
 
+@lru_cache(maxsize=4096)
+def _decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verify and decode an access token, memoized per token string
+    
+    Only successful decodes are cached (exceptions are not), but a cached
+    payload is returned even after the token expires, so callers must
+    check "exp" themselves.
+    
+    Args:
+        token: Encoded JWT
+        
+    Returns:
+        Decoded token payload
+    """
+    return jwt.decode(
+        token,
+        settings.jwt_secret_key,
+        algorithms=[settings.jwt_algorithm]
+    )
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserResponse:
     """Get current user from access token"""
     credentials_exception = HTTPException(
@@ -127,17 +152,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserResponse:
     )
     
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm]
-        )
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
+        payload = _decode_access_token(token)
     except jwt.PyJWTError:
         raise credentials_exception
     
+    # The decode is cached, so expiry has to be re-checked on every call
+    exp = payload.get("exp")
+    if exp is not None and time.time() >= exp:
+        raise credentials_exception
+    
+    user_id = payload.get("sub")
+    if user_id is None:
+        raise credentials_exception
+    
     user = await get_user_by_id(user_id)
     if user is None:
         raise credentials_exception
@@ -111,6 +111,7 @@ async def register_new_user(user_data: UserCreate) -> UserResponse:
     
     # Hash the password
     hashed_password = await get_password_hash(user_data.password)
+    now = datetime.utcnow()
     
     # Prepare user data for database
     db_user = {
@@ -120,8 +121,8 @@ async def register_new_user(user_data: UserCreate) -> UserResponse:
         "is_admin": False,
         "first_name": user_data.first_name,
         "last_name": user_data.last_name,
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
+        "created_at": now,
+        "updated_at": now
     }
     
     # Insert user and get the ID
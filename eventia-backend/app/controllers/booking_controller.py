@@ -7,12 +7,14 @@ Controller for booking-related operations
 from typing import Dict, List, Optional, Union, Any
 from datetime import datetime, timedelta
 from bson import ObjectId
+from pymongo import ReturnDocument
 from fastapi import HTTPException, status
 import uuid
 import asyncio
 
 from ..db.mongodb import get_collection
 from ..models.booking import Booking
+from ..models.event import EventModel
 from ..models.seat import SeatModel, SeatStatus
 from ..schemas.bookings import (
     BookingCreate, 
@@ -21,6 +23,7 @@ from ..schemas.bookings import (
     UTRSubmission, 
     BookingType
 )
+from ..schemas.seat import SeatReservationRequest, SeatBatchUpdate
 from ..config import settings
 from ..utils.logger import logger
 from ..controllers.seat_controller import SeatController
@@ -70,7 +73,6 @@ class BookingController:
                 user_id = str(uuid.uuid4())  # Generate a temporary user ID for seat reservation
 
                 # Create reservation request
-                from ..schemas.seat import SeatReservationRequest
                 reservation_request = SeatReservationRequest(
                     seat_ids=seat_ids,
                     user_id=user_id
@@ -82,6 +84,8 @@ class BookingController:
 
             # Create booking
             booking_id = str(uuid.uuid4())
+            created = datetime.utcnow()
+            now = created.isoformat()
             booking_dict = {
                 "booking_id": booking_id,
                 "event_id": booking_data.event_id,
@@ -90,8 +94,11 @@ class BookingController:
                 "status": "payment_pending",
                 "total_amount": total_amount,
                 "payment_verified": False,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
+                "created_at": now,
+                "updated_at": now,
+                # Unpaid bookings are removed by the bookings TTL index once
+                # this passes; submitting a UTR clears it
+                "expires_at": created + timedelta(minutes=settings.PAYMENT_EXPIRY_MINUTES)
             }
 
             # Add booking type specific fields
@@ -116,32 +123,15 @@ class BookingController:
                     detail="Failed to create booking"
                 )
 
-            # Get created booking
-            created_booking = await collection.find_one({"_id": result.inserted_id})
-
-            # Prepare response
-            response = {
-                "booking_id": booking_id,
-                "event_id": booking_data.event_id,
-                "customer_info": booking_data.customer_info.dict(),
-                "booking_type": booking_data.booking_type,
-                "status": "payment_pending",
-                "total_amount": total_amount,
-                "payment_verified": False,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
-            }
-
-            # Add booking type specific fields to response
-            if booking_data.booking_type == BookingType.SECTION:
-                response["selected_tickets"] = [ticket.dict() for ticket in booking_data.selected_tickets]
-
-            elif booking_data.booking_type == BookingType.SEAT:
-                response["selected_seats"] = [seat.dict() for seat in booking_data.selected_seats]
-                response["stadium_id"] = booking_data.stadium_id
-                response["seat_reservation_expires"] = seat_reservation_expires
+            # Reuse the inserted document (and its already dumped nested
+            # models) as the response, minus the storage-only fields
+            booking_dict.pop("_id", None)
+            booking_dict.pop("seat_reservation_user_id", None)
+            booking_dict.pop("expires_at", None)
+            if booking_data.booking_type == BookingType.SEAT:
+                booking_dict["seat_reservation_expires"] = seat_reservation_expires
 
-            return response
+            return booking_dict
 
         except HTTPException:
             raise
@@ -187,7 +177,6 @@ class BookingController:
                 logger.warning(f"Event not found for booking {booking_id}")
                 event_details = {"name": "Unknown Event", "status": "unknown"}
             else:
-                from ..models.event import EventModel
                 event_details = EventModel.from_mongo(event).dict()
 
             # Return booking with event details
@@ -330,7 +319,6 @@ class BookingController:
                 }
 
             # Update seats to unavailable status (permanently booked)
-            from ..schemas.seat import SeatBatchUpdate
             batch_update = SeatBatchUpdate(
                 seat_ids=seat_ids,
                 status=SeatStatus.UNAVAILABLE
@@ -338,13 +326,17 @@ class BookingController:
 
             result = await SeatController.batch_update_seats(batch_update)
 
-            # Update booking to mark seats as confirmed
+            # Update booking to mark seats as confirmed; a booking holding
+            # confirmed seats must not be expired by the TTL index
             await collection.update_one(
                 {"booking_id": booking_id},
-                {"$set": {
-                    "seat_reservation_confirmed": True,
-                    "updated_at": datetime.utcnow().isoformat()
-                }}
+                {
+                    "$set": {
+                        "seat_reservation_confirmed": True,
+                        "updated_at": datetime.utcnow().isoformat()
+                    },
+                    "$unset": {"expires_at": ""}
+                }
             )
 
             return {
@@ -378,8 +370,11 @@ class BookingController:
             # Get bookings collection
             collection = await get_collection("bookings")
 
-            # Find booking
-            booking = await collection.find_one({"booking_id": payment_data.booking_id})
+            # Find booking; only the type and seat IDs are needed to confirm seats
+            booking = await collection.find_one(
+                {"booking_id": payment_data.booking_id},
+                {"booking_type": 1, "selected_seats.seat_id": 1}
+            )
 
             if not booking:
                 raise HTTPException(
@@ -394,24 +389,32 @@ class BookingController:
                 "updated_at": datetime.utcnow().isoformat()
             }
 
-            # If this is a seat-based booking, confirm the seat reservation
+            # If this is a seat-based booking, confirm the seat reservation;
+            # the booking's confirmed flag goes out with the UTR update below
+            # instead of through a separate confirm_seat_reservation write
             if booking.get("booking_type") == BookingType.SEAT:
-                await BookingController.confirm_seat_reservation(payment_data.booking_id)
+                seat_ids = [seat["seat_id"] for seat in booking.get("selected_seats", [])]
+                if seat_ids:
+                    await SeatController.batch_update_seats(
+                        SeatBatchUpdate(seat_ids=seat_ids, status=SeatStatus.UNAVAILABLE)
+                    )
+                    update_data["seat_reservation_confirmed"] = True
 
-            result = await collection.update_one(
+            # Update and read back the booking in a single round-trip
+            updated_booking = await collection.find_one_and_update(
                 {"booking_id": payment_data.booking_id},
-                {"$set": update_data}
+                # A booking with a submitted UTR must not be expired by the TTL index
+                {"$set": update_data, "$unset": {"expires_at": ""}},
+                projection={"booking_id": 1, "status": 1},
+                return_document=ReturnDocument.AFTER
             )
 
-            if result.modified_count == 0:
+            if not updated_booking:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to update booking with payment information"
                 )
 
-            # Get updated booking
-            updated_booking = await collection.find_one({"booking_id": payment_data.booking_id})
-
             # Return updated booking
             return {
                 "booking_id": updated_booking["booking_id"],
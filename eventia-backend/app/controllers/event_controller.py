@@ -18,8 +18,9 @@ from ..models.event import EventModel
 from ..schemas.event import EventCreate, EventUpdate, EventInDB, EventSearchParams, EventResponse, EventListResponse
 from ..config import settings
 from ..utils.logger import logger
+from ..utils.object_id import parse_object_id
 from ..utils.file import verify_image_exists
-from ..utils.json_utils import serialize_dict
+from ..utils.json_utils import stringify_object_ids
 
 
 class EventController:
@@ -58,8 +59,8 @@ class EventController:
             # Convert to list of events and serialize datetime objects
             events = []
             async for doc in cursor:
-                # Convert ObjectId to string and serialize datetime objects
-                serialized_doc = serialize_dict(doc)
+                # Convert ObjectIds to strings; datetimes are validated as-is
+                serialized_doc = stringify_object_ids(doc)
                 # Now we can use the serialized document
                 event_model = EventModel.from_mongo(serialized_doc)
                 events.append(event_model)
@@ -98,17 +99,13 @@ class EventController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(event_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid event ID format"
-                )
+            object_id = parse_object_id(event_id, "event ID")
             
             # Get events collection
             collection = await get_collection(EventModel.get_collection_name())
             
             # Find event
-            event = await collection.find_one({"_id": ObjectId(event_id)})
+            event = await collection.find_one({"_id": object_id})
             
             if not event:
                 raise HTTPException(
@@ -124,8 +121,8 @@ class EventController:
                     event["poster_url"] = f"{settings.STATIC_URL}/placeholders/event-placeholder.jpg"
                     logger.warning(f"Event poster not found, using placeholder: {event_id}")
             
-            # Serialize the event to handle datetime and ObjectId
-            serialized_event = serialize_dict(event)
+            # Convert ObjectIds to strings; datetimes are validated as-is
+            serialized_event = stringify_object_ids(event)
             
             # Convert to Pydantic model and return
             model = EventModel.from_mongo(serialized_event)
@@ -180,8 +177,9 @@ class EventController:
             except AttributeError:
                 event_dict = event_data.dict()
                 
-            event_dict["created_at"] = datetime.utcnow()
-            event_dict["updated_at"] = datetime.utcnow()
+            now = datetime.utcnow()
+            event_dict["created_at"] = now
+            event_dict["updated_at"] = now
             
             result = await collection.insert_one(event_dict)
             
@@ -194,8 +192,8 @@ class EventController:
             # Get created event
             created_event = await collection.find_one({"_id": result.inserted_id})
             
-            # Serialize the created event to handle datetime and ObjectId
-            serialized_event = serialize_dict(created_event)
+            # Convert ObjectIds to strings; datetimes are validated as-is
+            serialized_event = stringify_object_ids(created_event)
             
             # Return created event
             model = EventModel.from_mongo(serialized_event)
@@ -230,17 +228,13 @@ class EventController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(event_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid event ID format"
-                )
+            object_id = parse_object_id(event_id, "event ID")
             
             # Get events collection
             collection = await get_collection(EventModel.get_collection_name())
             
             # Check if event exists
-            event = await collection.find_one({"_id": ObjectId(event_id)})
+            event = await collection.find_one({"_id": object_id})
             
             if not event:
                 raise HTTPException(
@@ -276,7 +270,7 @@ class EventController:
             
             # Update event
             result = await collection.update_one(
-                {"_id": ObjectId(event_id)},
+                {"_id": object_id},
                 {"$set": update_data}
             )
             
@@ -287,10 +281,10 @@ class EventController:
                 )
             
             # Get updated event
-            updated_event = await collection.find_one({"_id": ObjectId(event_id)})
+            updated_event = await collection.find_one({"_id": object_id})
             
-            # Serialize the updated event to handle datetime and ObjectId
-            serialized_event = serialize_dict(updated_event)
+            # Convert ObjectIds to strings; datetimes are validated as-is
+            serialized_event = stringify_object_ids(updated_event)
             
             # Return updated event
             model = EventModel.from_mongo(serialized_event)
@@ -324,17 +318,13 @@ class EventController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(event_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid event ID format"
-                )
+            object_id = parse_object_id(event_id, "event ID")
             
             # Get events collection
             collection = await get_collection(EventModel.get_collection_name())
             
             # Check if event exists
-            event = await collection.find_one({"_id": ObjectId(event_id)})
+            event = await collection.find_one({"_id": object_id})
             
             if not event:
                 raise HTTPException(
@@ -343,7 +333,7 @@ class EventController:
                 )
             
             # Delete event
-            result = await collection.delete_one({"_id": ObjectId(event_id)})
+            result = await collection.delete_one({"_id": object_id})
             
             if result.deleted_count == 0:
                 raise HTTPException(
@@ -24,6 +24,7 @@ from ..schemas.seat import (
 )
 from ..config import settings
 from ..utils.logger import logger
+from ..utils.object_id import parse_object_id
 
 
 class SeatController:
@@ -94,15 +95,16 @@ class SeatController:
             cursor = cursor.sort(sort_field, sort_direction)
             cursor = cursor.skip(skip).limit(params.limit)
             
-            # Convert to list of dicts
-            seats = await cursor.to_list(length=params.limit)
+            # Convert seats as the cursor yields them instead of
+            # materializing the raw documents first
+            items = [SeatController._convert_seat_to_schema(seat) async for seat in cursor]
             
             # Calculate total pages
             total_pages = (total + params.limit - 1) // params.limit
             
             # Create response
             return {
-                "items": [SeatController._convert_seat_to_schema(seat) for seat in seats],
+                "items": items,
                 "total": total,
                 "page": params.page,
                 "limit": params.limit,
@@ -132,17 +134,13 @@ class SeatController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(seat_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid seat ID format"
-                )
+            object_id = parse_object_id(seat_id, "seat ID")
             
             # Get seats collection
             collection = await get_collection(SeatModel.Config.collection_name)
             
             # Find seat
-            seat = await collection.find_one({"_id": ObjectId(seat_id)})
+            seat = await collection.find_one({"_id": object_id})
             
             if not seat:
                 raise HTTPException(
@@ -206,8 +204,9 @@ class SeatController:
             
             # Create seat
             seat_dict = seat_data.dict()
-            seat_dict["created_at"] = datetime.utcnow()
-            seat_dict["updated_at"] = datetime.utcnow()
+            now = datetime.utcnow()
+            seat_dict["created_at"] = now
+            seat_dict["updated_at"] = now
             
             result = await collection.insert_one(seat_dict)
             
@@ -249,17 +248,13 @@ class SeatController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(seat_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid seat ID format"
-                )
+            object_id = parse_object_id(seat_id, "seat ID")
             
             # Get seats collection
             collection = await get_collection(SeatModel.Config.collection_name)
             
             # Check if seat exists
-            seat = await collection.find_one({"_id": ObjectId(seat_id)})
+            seat = await collection.find_one({"_id": object_id})
             
             if not seat:
                 raise HTTPException(
@@ -275,7 +270,7 @@ class SeatController:
             
             # Update seat
             result = await collection.update_one(
-                {"_id": ObjectId(seat_id)},
+                {"_id": object_id},
                 {"$set": update_data}
             )
             
@@ -286,7 +281,7 @@ class SeatController:
                 )
             
             # Get updated seat
-            updated_seat = await collection.find_one({"_id": ObjectId(seat_id)})
+            updated_seat = await collection.find_one({"_id": object_id})
             
             # Return updated seat
             return SeatController._convert_seat_to_schema(updated_seat)
@@ -316,33 +311,21 @@ class SeatController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(seat_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid seat ID format"
-                )
+            object_id = parse_object_id(seat_id, "seat ID")
             
             # Get seats collection
             collection = await get_collection(SeatModel.Config.collection_name)
             
-            # Check if seat exists
-            seat = await collection.find_one({"_id": ObjectId(seat_id)})
+            # Delete seat; the delete itself reports whether the seat existed,
+            # so a concurrent delete cannot slip in after a separate check
+            result = await collection.delete_one({"_id": object_id})
             
-            if not seat:
+            if result.deleted_count == 0:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Seat with ID {seat_id} not found"
                 )
             
-            # Delete seat
-            result = await collection.delete_one({"_id": ObjectId(seat_id)})
-            
-            if result.deleted_count == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to delete seat with ID {seat_id}"
-                )
-            
             return {
                 "message": f"Seat with ID {seat_id} deleted successfully"
             }
@@ -435,9 +418,19 @@ class SeatController:
                     )
                 object_ids.append(ObjectId(seat_id))
             
-            # Check if seats exist and are available
-            seats = await collection.find({"_id": {"$in": object_ids}}).to_list(length=len(object_ids))
+            # Load seat statuses and the user's current reservation count
+            # concurrently; the two reads do not depend on each other
+            seats, user_reserved_seats = await asyncio.gather(
+                collection.find(
+                    {"_id": {"$in": object_ids}}, {"status": 1}
+                ).to_list(length=len(object_ids)),
+                collection.count_documents({
+                    "user_id": reservation_data.user_id,
+                    "status": SeatStatus.RESERVED
+                })
+            )
             
+            # Check if seats exist and are available
             if len(seats) != len(object_ids):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -454,11 +447,6 @@ class SeatController:
                 )
             
             # Check if user already has too many seats reserved
-            user_reserved_seats = await collection.count_documents({
-                "user_id": reservation_data.user_id,
-                "status": SeatStatus.RESERVED
-            })
-            
             if user_reserved_seats + len(object_ids) > SeatController.MAX_SEATS_PER_USER:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -469,27 +457,31 @@ class SeatController:
             reservation_time = datetime.utcnow()
             reservation_expires = reservation_time + timedelta(seconds=SeatController.RESERVATION_TIMEOUT)
             
-            # Update seats to reserved status
+            # Update seats to reserved status; the status condition makes the
+            # check-and-reserve atomic per seat, so a concurrent reservation
+            # cannot take over seats that were just reserved by someone else
             update_result = await collection.update_many(
-                {"_id": {"$in": object_ids}},
+                {"_id": {"$in": object_ids}, "status": SeatStatus.AVAILABLE},
                 {
                     "$set": {
                         "status": SeatStatus.RESERVED,
                         "user_id": reservation_data.user_id,
                         "reservation_time": reservation_time,
                         "reservation_expires": reservation_expires,
-                        "updated_at": datetime.utcnow()
+                        "updated_at": reservation_time
                     }
                 }
             )
             
             if update_result.modified_count != len(object_ids):
-                # Something went wrong, try to revert
+                # Another reservation won some of the seats; release the ones
+                # this request reserved
                 await collection.update_many(
                     {
                         "_id": {"$in": object_ids},
                         "user_id": reservation_data.user_id,
-                        "status": SeatStatus.RESERVED
+                        "status": SeatStatus.RESERVED,
+                        "reservation_time": reservation_time
                     },
                     {
                         "$set": {
@@ -503,8 +495,8 @@ class SeatController:
                 )
                 
                 raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to reserve all seats"
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="One or more seats were reserved by another user"
                 )
             
             # Get updated seats
@@ -606,11 +598,12 @@ class SeatController:
             collection = await get_collection(SeatModel.Config.collection_name)
             
             # Release seats that are still reserved and have expired
+            now = datetime.utcnow()
             result = await collection.update_many(
                 {
                     "_id": {"$in": seat_ids},
                     "status": SeatStatus.RESERVED,
-                    "reservation_expires": {"$lte": datetime.utcnow()}
+                    "reservation_expires": {"$lte": now}
                 },
                 {
                     "$set": {
@@ -618,7 +611,7 @@ class SeatController:
                         "user_id": None,
                         "reservation_time": None,
                         "reservation_expires": None,
-                        "updated_at": datetime.utcnow()
+                        "updated_at": now
                     }
                 }
             )
@@ -52,8 +52,8 @@ class StadiumController:
             # Determine sort direction
             sort_direction = 1 if params.order.lower() == "asc" else -1
             
-            # Get stadiums
-            stadiums = await Database.find(
+            # Get stadiums, converting each document as the cursor yields it
+            stadiums = await Database.find_cursor(
                 "stadiums",
                 query,
                 skip=skip,
@@ -63,7 +63,7 @@ class StadiumController:
             
             # Convert to list of StadiumModel instances
             stadium_list = []
-            for stadium in stadiums:
+            async for stadium in stadiums:
                 # Calculate total available seats across all sections
                 available_seats = 0
                 for section in stadium.get("sections", []):
@@ -163,19 +163,21 @@ class StadiumController:
             # Convert stadium data to dict
             stadium_dict = stadium_data.model_dump()
             
+            # One timestamp for the stadium and all of its sections
+            now = datetime.utcnow()
+            
             # Process sections if provided
             if "sections" in stadium_dict and stadium_dict["sections"]:
                 for i, section in enumerate(stadium_dict["sections"]):
                     # Generate section ID
                     section["id"] = str(uuid.uuid4())
-                    section["created_at"] = datetime.utcnow()
-                    section["updated_at"] = datetime.utcnow()
+                    section["created_at"] = now
+                    section["updated_at"] = now
                     
                     # Set available seats equal to capacity initially
                     section["available"] = section["capacity"]
             
             # Generate stadium data
-            now = datetime.utcnow()
             stadium = {
                 "_id": str(uuid.uuid4()),
                 **stadium_dict,
@@ -305,10 +307,11 @@ class StadiumController:
             
             # Create section model
             section_dict = section_data.model_dump()
+            now = datetime.utcnow()
             section_dict.update({
                 "id": str(uuid.uuid4()),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
+                "created_at": now,
+                "updated_at": now,
                 "available": section_dict["capacity"]  # Initially all seats are available
             })
             
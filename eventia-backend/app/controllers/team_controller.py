@@ -16,6 +16,7 @@ from ..models.team import TeamModel
 from ..schemas.team import TeamCreate, TeamUpdate, TeamInDB, TeamSearchParams
 from ..config import settings
 from ..utils.logger import logger
+from ..utils.object_id import parse_object_id
 from ..utils.file import verify_image_exists, get_placeholder_image
 
 
@@ -109,17 +110,13 @@ class TeamController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(team_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid team ID format"
-                )
+            object_id = parse_object_id(team_id, "team ID")
             
             # Get teams collection
             collection = await get_collection(TeamModel.get_collection_name())
             
             # Find team
-            team = await collection.find_one({"_id": ObjectId(team_id)})
+            team = await collection.find_one({"_id": object_id})
             
             if not team:
                 raise HTTPException(
@@ -180,8 +177,9 @@ class TeamController:
             
             # Create team
             team_dict = team_data.dict()
-            team_dict["created_at"] = datetime.utcnow()
-            team_dict["updated_at"] = datetime.utcnow()
+            now = datetime.utcnow()
+            team_dict["created_at"] = now
+            team_dict["updated_at"] = now
             
             result = await collection.insert_one(team_dict)
             
@@ -223,17 +221,13 @@ class TeamController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(team_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid team ID format"
-                )
+            object_id = parse_object_id(team_id, "team ID")
             
             # Get teams collection
             collection = await get_collection(TeamModel.get_collection_name())
             
             # Check if team exists
-            team = await collection.find_one({"_id": ObjectId(team_id)})
+            team = await collection.find_one({"_id": object_id})
             
             if not team:
                 raise HTTPException(
@@ -244,7 +238,7 @@ class TeamController:
             # Check if code is being updated and if it conflicts
             if team_data.code and team_data.code != team.get("code"):
                 existing_team = await collection.find_one({"code": team_data.code})
-                if existing_team and existing_team["_id"] != ObjectId(team_id):
+                if existing_team and existing_team["_id"] != object_id:
                     raise HTTPException(
                         status_code=status.HTTP_409_CONFLICT,
                         detail=f"Team with code {team_data.code} already exists"
@@ -264,7 +258,7 @@ class TeamController:
             
             # Update team
             result = await collection.update_one(
-                {"_id": ObjectId(team_id)},
+                {"_id": object_id},
                 {"$set": update_data}
             )
             
@@ -275,7 +269,7 @@ class TeamController:
                 )
             
             # Get updated team
-            updated_team = await collection.find_one({"_id": ObjectId(team_id)})
+            updated_team = await collection.find_one({"_id": object_id})
             
             # Return updated team
             return TeamModel.from_mongo(updated_team).dict()
@@ -305,17 +299,13 @@ class TeamController:
         """
         try:
             # Validate ID
-            if not ObjectId.is_valid(team_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid team ID format"
-                )
+            object_id = parse_object_id(team_id, "team ID")
             
             # Get teams collection
             collection = await get_collection(TeamModel.get_collection_name())
             
             # Check if team exists
-            team = await collection.find_one({"_id": ObjectId(team_id)})
+            team = await collection.find_one({"_id": object_id})
             
             if not team:
                 raise HTTPException(
@@ -325,7 +315,7 @@ class TeamController:
             
             # Check if team is used in any events
             events_collection = await get_collection("events")
-            event_count = await events_collection.count_documents({"team_ids": ObjectId(team_id)})
+            event_count = await events_collection.count_documents({"team_ids": object_id})
             
             if event_count > 0:
                 raise HTTPException(
@@ -334,7 +324,7 @@ class TeamController:
                 )
             
             # Delete team
-            result = await collection.delete_one({"_id": ObjectId(team_id)})
+            result = await collection.delete_one({"_id": object_id})
             
             if result.deleted_count == 0:
                 raise HTTPException(
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Union
 import secrets
 from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
@@ -47,9 +48,11 @@ async def get_user(user_id: str) -> Optional[UserResponse]:
     users_collection = await get_user_collection()
     
     try:
-        user_obj = await users_collection.find_one({"_id": ObjectId(user_id)})
-    except:
+        object_id = ObjectId(user_id)
+    except (InvalidId, TypeError):
         return None
+    
+    user_obj = await users_collection.find_one({"_id": object_id})
         
     if user_obj:
         user_obj["id"] = str(user_obj.pop("_id"))
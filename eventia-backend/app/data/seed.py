@@ -5,7 +5,6 @@ Script to seed the database with initial data for development and testing
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -274,15 +273,8 @@ async def seed_payment_settings():
     # Get settings collection
     collection = await get_collection("settings")
     
-    # Check if payment settings already exist
-    count = await collection.count_documents({"type": "payment_settings"})
-    if count > 0:
-        logger.info(f"Payment settings already exist, skipping seeding")
-        return
-    
     # Sample payment settings
     payment_settings = {
-        "type": "payment_settings",
         "merchant_name": "Eventia Ticketing",
         "vpa": "eventia@upi",
         "vpaAddress": "eventia@upi",
@@ -292,11 +284,20 @@ async def seed_payment_settings():
         "updated_at": datetime.utcnow().isoformat()
     }
     
-    # Insert payment settings
-    result = await collection.insert_one(payment_settings)
+    # Insert payment settings unless they already exist; the upsert checks
+    # and inserts atomically, so concurrent seeds cannot create duplicates
+    result = await collection.update_one(
+        {"type": "payment_settings"},
+        {"$setOnInsert": payment_settings},
+        upsert=True
+    )
+    if result.upserted_id is None:
+        logger.info(f"Payment settings already exist, skipping seeding")
+        return
+    
     logger.info(f"Inserted payment settings")
     
-    return result.inserted_id
+    return result.upserted_id
 
 
 async def seed_database():
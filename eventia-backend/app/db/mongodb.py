@@ -2,58 +2,61 @@
 MongoDB connection and utilities
 """
 
-import os
+import asyncio
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import MongoClient
+from pymongo import IndexModel
 from pymongo.errors import ConnectionFailure
 
+from app.config import settings
+from app.services.database import Database
+from app.utils.logger import logger
+
 # Global MongoDB client and database instances
 client: Optional[AsyncIOMotorClient] = None
 db = None
 database = None  # Alias for db to maintain compatibility
 
 async def connect_to_mongo():
-    """Connect to MongoDB"""
+    """Connect to MongoDB through the shared, pooled Database client"""
     global client, db, database
     
     try:
-        # Get MongoDB connection string from environment
-        mongo_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-        
-        # Create async client
-        client = AsyncIOMotorClient(mongo_url)
+        # Reuse the process-wide client so there is a single connection pool
+        client = await Database.get_client()
         
         # Test the connection
         await client.admin.command('ping')
         
+        # Open minPoolSize sockets now with concurrent pings, so the first
+        # burst of requests does not wait on connection handshakes
+        await asyncio.gather(*[
+            client.admin.command('ping') for _ in range(settings.MONGODB_MIN_POOL_SIZE)
+        ])
+        
         # Get the database
-        db = client.eventia
+        db = await Database.get_db()
         database = db  # Set the alias
         
-        print("Connected to MongoDB successfully")
+        logger.info("Connected to MongoDB successfully")
         
     except ConnectionFailure as e:
-        print(f"Failed to connect to MongoDB: {str(e)}")
+        logger.exception(f"Failed to connect to MongoDB: {str(e)}")
         raise
 
 async def close_mongo_connection():
     """Close MongoDB connection"""
     global client, db, database
     if client:
-        client.close()
+        await Database.close()
+        client = None
         db = None
         database = None
-        print("MongoDB connection closed")
+        logger.info("MongoDB connection closed")
 
 async def get_collection(collection_name: str):
-    """Get a MongoDB collection"""
-    global db
-    
-    if db is None:
-        await connect_to_mongo()
-    
-    return db[collection_name]
+    """Get a MongoDB collection from the shared Database client"""
+    return await Database.get_collection(collection_name)
 
 async def initialize_indexes():
     """Initialize indexes for all collections"""
@@ -69,10 +72,16 @@ async def initialize_indexes():
             collection = await get_collection(model.get_collection_name())
             indexes = model.get_indexes()
             
-            for index in indexes:
-                await collection.create_index(index)
+            # A trailing dict in an index spec holds its options (e.g. unique)
+            index_models = [
+                IndexModel(index[:-1], **index[-1]) if isinstance(index[-1], dict) else IndexModel(index)
+                for index in indexes
+            ]
+            
+            # One createIndexes command per collection
+            await collection.create_indexes(index_models)
             
-            print(f"Created indexes for collection: {model.get_collection_name()}")
+            logger.info(f"Created indexes for collection: {model.get_collection_name()}")
         except Exception as e:
-            print(f"Failed to create index for {model.get_collection_name()}: {str(e)}")
+            logger.error(f"Failed to create index for {model.get_collection_name()}: {str(e)}")
             raise
\ No newline at end of file
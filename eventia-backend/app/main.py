@@ -9,8 +9,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse as FastAPIJSONResponse
-import json
 from datetime import datetime
 from bson import ObjectId
 
@@ -28,20 +26,9 @@ from .utils.logger import logger
 from .middleware.security import SecurityHeadersMiddleware
 from .middleware.error_handlers import register_exception_handlers
 from .middleware.rate_limiter import RateLimiter
-from .utils.json_utils import CustomJSONEncoder
-
-
-# Custom JSON encoder for the FastAPI app
-class JSONResponse(FastAPIJSONResponse):
-    def render(self, content) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-            cls=CustomJSONEncoder,
-        ).encode("utf-8")
+from .utils.json_utils import ORJSONResponse
+from .services.database import Database
+from .db.mongodb import connect_to_mongo, close_mongo_connection
 
 
 # Create FastAPI app
@@ -52,7 +39,7 @@ app = FastAPI(
     docs_url=None,  # Custom docs URL below
     redoc_url="/redoc" if settings.DEBUG else None,
     openapi_url="/api/openapi.json",  # Set OpenAPI schema URL
-    default_response_class=JSONResponse,  # Use custom JSONResponse
+    default_response_class=ORJSONResponse,  # Serialize responses with orjson
 )
 
 # Configure CORS
@@ -135,11 +122,33 @@ async def startup_event():
     logger.info(f"Debug mode: {settings.DEBUG}")
     logger.info(f"API URL: {settings.API_BASE_URL}")
     logger.info(f"Frontend URL: {settings.FRONTEND_BASE_URL}")
+    
+    # Open the shared connection pool now so the first request does not pay for it
+    try:
+        await connect_to_mongo()
+    except Exception as e:
+        logger.error(f"Error connecting to MongoDB: {str(e)}")
+    
+    # Make sure the hot query paths are backed by indexes
+    try:
+        await Database.ensure_indexes()
+    except Exception as e:
+        logger.error(f"Error creating database indexes: {str(e)}")
+    
+    # Share seat update broadcasts across workers when Redis is configured
+    try:
+        await seats.connection_manager.start_pubsub(settings.REDIS_URL)
+    except Exception as e:
+        logger.error(f"Error starting WebSocket pub/sub: {str(e)}")
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Shutting down Eventia API...")
+    await seats.connection_manager.stop_pubsub()
+    await close_mongo_connection()
+    # Flush records still queued for the background file sinks
+    await logger.complete()
 
 # Root endpoint
 @app.get("/")
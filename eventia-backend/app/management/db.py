@@ -24,14 +24,22 @@ async def init_db():
         "API_DOMAIN": settings.API_DOMAIN,
     }
 
-    # Check and add missing settings
-    for setting_name, setting_value in required_settings.items():
-        setting_exists = await engine.client[settings.DATABASE_NAME][settings_collection_name].find_one(
-            {"name": setting_name}
+    # Look up which settings already exist in a single query
+    settings_collection = engine.client[settings.DATABASE_NAME][settings_collection_name]
+    existing_names = {
+        setting["name"]
+        async for setting in settings_collection.find(
+            {"name": {"$in": list(required_settings)}}, {"name": 1, "_id": 0}
         )
+    }
 
-        if not setting_exists:
-            await engine.client[settings.DATABASE_NAME][settings_collection_name].insert_one(
-                {"name": setting_name, "value": setting_value}
-            )
-            print(f"Added missing setting: '{setting_name}' with value '{setting_value}'.")
\ No newline at end of file
+    # Add the missing settings in one insert
+    missing_settings = [
+        {"name": setting_name, "value": setting_value}
+        for setting_name, setting_value in required_settings.items()
+        if setting_name not in existing_names
+    ]
+    if missing_settings:
+        await settings_collection.insert_many(missing_settings, ordered=False)
+        for setting in missing_settings:
+            print(f"Added missing setting: '{setting['name']}' with value '{setting['value']}'.")
\ No newline at end of file
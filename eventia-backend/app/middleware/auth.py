@@ -4,9 +4,10 @@ Authentication middleware
 Authentication dependencies and utilities
 """
 
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Union, Dict, Any
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -15,6 +16,8 @@ from pydantic import BaseModel
 from ..db.mongodb import get_collection
 from ..config import settings
 from ..utils.logger import logger
+from ..utils.security import verify_admin_token
+from ..utils.cache import TTLCache
 
 
 # Password hashing context
@@ -23,6 +26,16 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 token URL
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
+# The static admin token once verified; there is only one valid token,
+# so a single slot is enough
+ADMIN_TOKEN_CACHE_TTL = 60
+_admin_token_cache = TTLCache(ttl=ADMIN_TOKEN_CACHE_TTL, maxsize=1)
+
+# Recently decoded bearer tokens: token -> JWT payload
+TOKEN_PAYLOAD_CACHE_TTL = 60
+TOKEN_PAYLOAD_CACHE_SIZE = 1024
+_token_payload_cache = TTLCache(ttl=TOKEN_PAYLOAD_CACHE_TTL, maxsize=TOKEN_PAYLOAD_CACHE_SIZE)
+
 
 class TokenData(BaseModel):
     """Token data model"""
@@ -123,10 +136,41 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     return encoded_jwt
 
 
+def _decode_token_cached(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT, reusing successful decodes for up to
+    TOKEN_PAYLOAD_CACHE_TTL seconds
+    
+    Only the signature check is cached, never past the token's own expiry;
+    the user is still loaded on every request so deactivations and role
+    changes apply immediately.
+    
+    Args:
+        token: JWT token
+        
+    Returns:
+        Decoded token payload
+        
+    Raises:
+        JWTError: If the token is invalid or expired
+    """
+    payload = _token_payload_cache.get(token)
+    if payload is not None:
+        return payload
+    
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    exp = payload.get("exp")
+    _token_payload_cache.set(token, payload, None if exp is None else exp - time.time())
+    return payload
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
     """
     Get current user from token
     
+    Token decodes are cached briefly so bursts of authenticated (and
+    admin) requests skip the signature check.
+    
     Args:
         token: JWT token
         
@@ -144,7 +188,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any
     
     try:
         # Decode token
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = _decode_token_cached(token)
         username: str = payload.get("sub")
         
         if username is None:
@@ -185,4 +229,58 @@ async def get_admin_user(current_user: Dict[str, Any] = Depends(get_current_user
             detail="Not authorized to perform this action"
         )
     
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+def _verify_admin_token_cached(token: str) -> bool:
+    """
+    Verify an admin token, reusing successful verifications for ADMIN_TOKEN_CACHE_TTL seconds
+    
+    Only a valid token is cached, so invalid guesses always go through the
+    constant-time comparison.
+    
+    Args:
+        token: Token presented by the client
+        
+    Returns:
+        True if the token is valid, False otherwise
+    """
+    if _admin_token_cache.get(token):
+        return True
+    
+    if not verify_admin_token(token):
+        return False
+    
+    _admin_token_cache.set(token, True)
+    return True
+
+
+async def require_admin_token(authorization: str = Header("")) -> bool:
+    """
+    Require the static admin token as a Bearer token
+    
+    Args:
+        authorization: Authorization header value
+        
+    Returns:
+        True if the token is valid
+        
+    Raises:
+        HTTPException: If the header is missing or the token is invalid
+    """
+    if not authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    if not _verify_admin_token_cached(authorization[7:]):
+        logger.warning("Invalid admin token presented")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return True
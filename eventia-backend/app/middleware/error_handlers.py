@@ -10,29 +10,16 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException
 from pydantic import ValidationError
+from pymongo.errors import ConnectionFailure
 from typing import Any, Dict, Union
 from datetime import datetime
 
 from app.schemas.common import ErrorResponse, ValidationErrorResponse
-from app.utils.json_utils import CustomJSONEncoder
-import json
+from app.utils.json_utils import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 
-# Custom JSON response that uses our CustomJSONEncoder
-class CustomJSONResponse(JSONResponse):
-    def render(self, content) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-            cls=CustomJSONEncoder,
-        ).encode("utf-8")
-
-
 def register_exception_handlers(app: FastAPI) -> None:
     """
     Register global exception handlers for the application
@@ -47,7 +34,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         """
         # Log the exception
         logger.warning(
-            f"HTTP {exc.status_code} - {exc.detail} - {request.method} {request.url.path}"
+            "HTTP %s - %s - %s %s", exc.status_code, exc.detail, request.method, request.url.path
         )
         
         # Create standardized error response
@@ -57,7 +44,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             path=request.url.path
         )
         
-        return CustomJSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=error.dict(),
             headers=getattr(exc, "headers", None)
@@ -74,21 +61,44 @@ def register_exception_handlers(app: FastAPI) -> None:
         """
         # Log the exception
         errors = exc.errors()
-        error_messages = ", ".join([f"{e['loc']}: {e['msg']}" for e in errors])
-        logger.warning(
-            f"Validation error - {error_messages} - {request.method} {request.url.path}"
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            error_messages = ", ".join([f"{e['loc']}: {e['msg']}" for e in errors])
+            logger.warning(
+                "Validation error - %s - %s %s", error_messages, request.method, request.url.path
+            )
         
         # Create standardized validation error response
         error = ValidationErrorResponse(
-            detail=errors,
+            detail=errors
         )
         
-        return CustomJSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content=error.dict()
         )
     
+    @app.exception_handler(ConnectionFailure)
+    async def database_unavailable_handler(request: Request, exc: ConnectionFailure) -> JSONResponse:
+        """
+        Handle transient MongoDB connection errors (server selection
+        timeouts, dropped connections) as 503 so clients can retry
+        """
+        logger.error(
+            "Database unavailable - %s - %s %s", exc, request.method, request.url.path
+        )
+        
+        error = ErrorResponse(
+            detail="Database temporarily unavailable",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            path=request.url.path
+        )
+        
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=error.dict(),
+            headers={"Retry-After": "5"}
+        )
+    
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
         """
@@ -96,7 +106,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         """
         # Log the exception with full traceback
         logger.exception(
-            f"Unhandled exception - {str(exc)} - {request.method} {request.url.path}"
+            "Unhandled exception - %s - %s %s", exc, request.method, request.url.path
         )
         
         # Create standardized error response
@@ -108,7 +118,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             path=request.url.path
         )
         
-        return CustomJSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=error.dict()
         ) 
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import List
+from collections import deque
+from typing import Deque, Dict, List
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
 import time
@@ -18,7 +19,8 @@ class RateLimiter(BaseHTTPMiddleware):
         self.time_window = time_window
         self.exempted_routes = exempted_routes
         self.exempted_ips = exempted_ips
-        self.request_counts = {}
+        # Request timestamps per client IP, oldest first
+        self.request_counts: Dict[str, Deque[float]] = {}
 
     async def dispatch(self, request: Request, call_next):
         client_ip = request.client.host
@@ -28,20 +30,20 @@ class RateLimiter(BaseHTTPMiddleware):
             return await call_next(request)
 
         current_time = time.time()
-        if client_ip not in self.request_counts:
-            self.request_counts[client_ip] = []
+        timestamps = self.request_counts.get(client_ip)
+        if timestamps is None:
+            timestamps = self.request_counts[client_ip] = deque()
 
-        self.request_counts[client_ip] = [
-            req_time
-            for req_time in self.request_counts[client_ip]
-            if current_time - req_time < self.time_window
-        ]
+        # Drop requests that have fallen out of the window
+        cutoff = current_time - self.time_window
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
-        if len(self.request_counts[client_ip]) >= self.rate_limit:
+        if len(timestamps) >= self.rate_limit:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded",
             )
 
-        self.request_counts[client_ip].append(current_time)
-        return await call_next(request)
\ No newline at end of file
+        timestamps.append(current_time)
+        return await call_next(request)
@@ -7,6 +7,7 @@ Base models for MongoDB with common functionality
 from typing import Any, Dict, Optional, Type
 from datetime import datetime
 from bson import ObjectId
+from bson.errors import InvalidId
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -19,9 +20,15 @@ class PyObjectId(str):
     
     @classmethod
     def validate(cls, v):
-        if not ObjectId.is_valid(v):
+        if isinstance(v, ObjectId):
+            return str(v)
+        # ObjectId(None) would generate a fresh id rather than fail
+        if v is None:
+            raise ValueError("Invalid ObjectId")
+        try:
+            return str(ObjectId(v))
+        except (InvalidId, TypeError):
             raise ValueError("Invalid ObjectId")
-        return str(ObjectId(v))
     
     @classmethod
     def __get_pydantic_json_schema__(cls, _schema_generator, _field):
@@ -98,7 +105,7 @@ class MongoBaseModel(BaseModel):
         if "_id" in data and not isinstance(data["_id"], ObjectId):
             try:
                 data["_id"] = ObjectId(data["_id"])
-            except:
+            except (InvalidId, TypeError):
                 pass
                 
         return data
\ No newline at end of file
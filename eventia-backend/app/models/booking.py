@@ -76,7 +76,7 @@ class BookingModel(MongoBaseModel):
     def get_indexes(cls):
         return [
             [("user_id", 1)],
-            [("event_id", 1)],
+            [("event_id", 1), ("status", 1)],
             [("status", 1)],
             [("created_at", -1)],
         ]
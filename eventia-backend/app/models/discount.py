@@ -6,14 +6,20 @@
 """
 Discount data models, validation, and database operations for Eventia.
 """
+import base64
+import binascii
+import warnings
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pydantic import BaseModel, Field, validator
-import uuid
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
 
-from app.core.database import db, serialize_object_id
-from app.core.config import logger
+from app.db.mongodb import get_collection
+from app.utils.logger import logger
+from app.utils.security import generate_unique_id
+from app.utils.cache import TTLCache
 
 
 class DiscountBase(BaseModel):
@@ -59,7 +65,8 @@ class DiscountBase(BaseModel):
     @validator('end_date')
     def validate_end_after(cls, v: str, values: Dict[str, Any]) -> str:
         start = values.get('start_date')
-        if start and datetime.strptime(v, '%Y-%m-%d') < datetime.strptime(start, '%Y-%m-%d'):
+        # Both dates are already validated as YYYY-MM-DD, which sorts the same as a string
+        if start and v < start:
             raise ValueError('end_date must be after start_date')
         return v
 
@@ -156,6 +163,69 @@ class DiscountList(BaseModel):
     """Paginated list of discounts."""
     discounts: List[DiscountResponse]
     total: int
+    next_cursor: Optional[str] = None
+
+
+# Recent code lookups for verify_discount: code -> discount
+DISCOUNT_CACHE_TTL = 10
+DISCOUNT_CACHE_SIZE = 1024
+_discount_cache = TTLCache(ttl=DISCOUNT_CACHE_TTL, maxsize=DISCOUNT_CACHE_SIZE)
+
+
+async def _get_discount_by_code_cached(code: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a discount by code, reusing lookups from the last DISCOUNT_CACHE_TTL seconds.
+    
+    Only found codes are cached: each worker has its own cache, so a
+    cached miss would keep a code created through another worker invalid
+    here until it expired.
+    
+    Args:
+        code: Discount code
+        
+    Returns:
+        Discount data or None if not found
+    """
+    cached = _discount_cache.get(code)
+    if cached is not None:
+        return cached
+    
+    discount = await get_discount_by_code(code)
+    if discount is not None:
+        _discount_cache.set(code, discount)
+    return discount
+
+
+def _encode_discount_cursor(discount_id: ObjectId) -> str:
+    """
+    Encode a page position as an opaque, URL-safe cursor string.
+    
+    Args:
+        discount_id: _id of the last discount on the page
+        
+    Returns:
+        Cursor string
+    """
+    return base64.urlsafe_b64encode(discount_id.binary).decode()
+
+
+def _decode_discount_cursor(cursor: str) -> ObjectId:
+    """
+    Decode a cursor produced by _encode_discount_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        
+    Returns:
+        _id of the last discount on the previous page
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        return ObjectId(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, InvalidId, TypeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
 
 
 # Database operations (CRUD and verification) follow...
@@ -164,21 +234,43 @@ async def get_discounts(
     skip: int = 0, 
     limit: int = 20, 
     is_active: Optional[bool] = None,
-    event_id: Optional[str] = None
+    event_id: Optional[str] = None,
+    after: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Get discounts with optional filtering and pagination.
+    Get discounts with optional filtering and keyset pagination.
+    
+    Pages are ordered newest first by _id, which every discount has and
+    which follows creation order. Passing the previous page's next_cursor
+    as after continues from that document through the _id index instead
+    of skipping over earlier pages.
     
     Args:
-        skip: Number of records to skip for pagination
+        skip: Deprecated offset pagination; pass after instead
         limit: Maximum number of records to return
         is_active: Filter by active status if provided
         event_id: Filter by event ID if provided
+        after: next_cursor returned with the previous page
         
     Returns:
-        Dictionary with discounts list and total count
+        Dictionary with discounts list, total count and next_cursor
+        (None when there are no further pages)
+        
+    Raises:
+        ValueError: If after is not a valid cursor
     """
+    after_id = _decode_discount_cursor(after) if after else None
+    if skip:
+        warnings.warn(
+            "get_discounts(skip=...) is deprecated; page with after=next_cursor instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
+    
     try:
+        collection = await get_collection("discounts")
+        
+
         # Build filter query
         query = {}
         if is_active is not None:
@@ -190,19 +282,32 @@ async def get_discounts(
             ]
         
         # Count total matching discounts
-        total = await db.discounts.count_documents(query)
-        
-        # Get paginated discounts
-        cursor = db.discounts.find(query).sort("created_at", -1).skip(skip).limit(limit)
+        total = await collection.count_documents(query)
+        
+        # Resume strictly after the previous page's last _id
+        page_query = query
+        if after_id:
+            page_query = {"$and": [query, {"_id": {"$lt": after_id}}]}
+        
+        # Get paginated discounts; batch_size matches the page so the whole
+        # page comes back in the first batch without a getMore
+        cursor = collection.find(page_query).sort("_id", -1)
+        if skip:
+            cursor = cursor.skip(skip)
+        cursor = cursor.limit(limit).batch_size(limit)
         discounts = await cursor.to_list(length=limit)
         
+        next_cursor = None
+        if len(discounts) == limit:
+            next_cursor = _encode_discount_cursor(discounts[-1]["_id"])
+        
         # Convert MongoDB ObjectIds to strings
         for discount in discounts:
             discount["id"] = discount.get("id", str(discount.get("_id", "")))
             if "_id" in discount:
                 del discount["_id"]
         
-        return {"discounts": discounts, "total": total}
+        return {"discounts": discounts, "total": total, "next_cursor": next_cursor}
     
     except Exception as e:
         logger.error(f"Error getting discounts: {str(e)}")
@@ -219,13 +324,14 @@ async def get_discount_by_id(discount_id: str) -> Optional[Dict[str, Any]]:
         Discount data or None if not found
     """
     try:
-        discount = await db.discounts.find_one({"id": discount_id})
+        collection = await get_collection("discounts")
+        discount = await collection.find_one({"id": discount_id})
         
         if not discount:
             # Try by ObjectId if not found by id
             if len(discount_id) == 24 and all(c in '0123456789abcdefABCDEF' for c in discount_id):
                 try:
-                    discount = await db.discounts.find_one({"_id": ObjectId(discount_id)})
+                    discount = await collection.find_one({"_id": ObjectId(discount_id)})
                 except Exception as e:
                     logger.warning(f"Failed to query discount by ObjectId: {str(e)}")
         
@@ -253,7 +359,8 @@ async def get_discount_by_code(code: str) -> Optional[Dict[str, Any]]:
         Discount data or None if not found
     """
     try:
-        discount = await db.discounts.find_one({"code": code})
+        collection = await get_collection("discounts")
+        discount = await collection.find_one({"code": code})
         
         if discount:
             discount["id"] = discount.get("id", str(discount.get("_id", "")))
@@ -268,6 +375,64 @@ async def get_discount_by_code(code: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Error getting discount by code {code}: {str(e)}")
         raise
 
+def evaluate_discount(
+    discount: Dict[str, Any],
+    ticket_count: int = 1,
+    order_value: Optional[float] = None,
+    event_id: Optional[str] = None,
+    current_date: Optional[str] = None
+) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Check a discount's rules against an order without touching the database.
+    
+    Args:
+        discount: Discount data
+        ticket_count: Number of tickets in the order
+        order_value: Total value of the order
+        event_id: Event ID if applicable
+        current_date: Today's date as YYYY-MM-DD (defaults to now)
+        
+    Returns:
+        Tuple of (reason the discount cannot be used or None, discount amount)
+    """
+    # Check if discount is active
+    if not discount.get("is_active", False):
+        return "Discount code is not active", None
+    
+    # Check dates
+    if current_date is None:
+        current_date = datetime.now().strftime("%Y-%m-%d")
+    if discount["start_date"] > current_date:
+        return f"Discount code is not valid yet. Valid from {discount['start_date']}", None
+    if discount["end_date"] < current_date:
+        return "Discount code has expired", None
+    
+    # Check usage count
+    if discount.get("max_uses") and discount.get("current_uses", 0) >= discount["max_uses"]:
+        return "Discount code has reached maximum uses", None
+    
+    # Check minimum ticket count
+    if discount.get("min_ticket_count") and ticket_count < discount["min_ticket_count"]:
+        return f"Minimum {discount['min_ticket_count']} tickets required to use this discount", None
+    
+    # Check minimum order value
+    if discount.get("min_order_value") and order_value and order_value < discount["min_order_value"]:
+        return f"Minimum order value of {discount['min_order_value']} required to use this discount", None
+    
+    # Check event specificity
+    if discount.get("event_specific") and discount.get("event_id") and event_id != discount["event_id"]:
+        return "Discount code is not valid for this event", None
+    
+    # Calculate discount amount
+    discount_amount = None
+    if order_value:
+        if discount["discount_type"] == "percentage":
+            discount_amount = order_value * (discount["value"] / 100)
+        else:  # fixed_amount
+            discount_amount = min(discount["value"], order_value)  # Can't discount more than order value
+    
+    return None, discount_amount
+
 async def verify_discount(
     code: str, 
     ticket_count: int = 1, 
@@ -288,7 +453,7 @@ async def verify_discount(
     """
     try:
         # Find discount by code
-        discount = await get_discount_by_code(code)
+        discount = await _get_discount_by_code_cached(code)
         
         if not discount:
             return {
@@ -298,77 +463,15 @@ async def verify_discount(
                 "discount_amount": None
             }
         
-        # Check if discount is active
-        if not discount.get("is_active", False):
-            return {
-                "valid": False, 
-                "message": "Discount code is not active",
-                "discount": None,
-                "discount_amount": None
-            }
-        
-        # Check dates
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        if discount["start_date"] > current_date:
-            return {
-                "valid": False,
-                "message": f"Discount code is not valid yet. Valid from {discount['start_date']}",
-                "discount": None,
-                "discount_amount": None
-            }
-            
-        if discount["end_date"] < current_date:
-            return {
-                "valid": False,
-                "message": "Discount code has expired",
-                "discount": None,
-                "discount_amount": None
-            }
-        
-        # Check usage count
-        if discount.get("max_uses") and discount.get("current_uses", 0) >= discount["max_uses"]:
-            return {
-                "valid": False,
-                "message": "Discount code has reached maximum uses",
-                "discount": None,
-                "discount_amount": None
-            }
-        
-        # Check minimum ticket count
-        if discount.get("min_ticket_count") and ticket_count < discount["min_ticket_count"]:
-            return {
-                "valid": False,
-                "message": f"Minimum {discount['min_ticket_count']} tickets required to use this discount",
-                "discount": None, 
-                "discount_amount": None
-            }
-        
-        # Check minimum order value
-        if discount.get("min_order_value") and order_value and order_value < discount["min_order_value"]:
+        reason, discount_amount = evaluate_discount(discount, ticket_count, order_value, event_id)
+        if reason:
             return {
                 "valid": False,
-                "message": f"Minimum order value of {discount['min_order_value']} required to use this discount",
+                "message": reason,
                 "discount": None,
                 "discount_amount": None
             }
         
-        # Check event specificity
-        if discount.get("event_specific") and discount.get("event_id") and event_id != discount["event_id"]:
-            return {
-                "valid": False,
-                "message": "Discount code is not valid for this event",
-                "discount": None,
-                "discount_amount": None
-            }
-        
-        # Calculate discount amount
-        discount_amount = None
-        if order_value:
-            if discount["discount_type"] == "percentage":
-                discount_amount = order_value * (discount["value"] / 100)
-            else:  # fixed_amount
-                discount_amount = min(discount["value"], order_value)  # Can't discount more than order value
-        
         # Success - discount is valid
         return {
             "valid": True,
@@ -395,19 +498,25 @@ async def create_discount(discount_data: Dict[str, Any]) -> Dict[str, Any]:
         
     Returns:
         Created discount data with ID
+        
+    Raises:
+        ValueError: If the discount has no code
     """
+    if not discount_data.get("code"):
+        raise ValueError("Discount code is required")
+    
     try:
         # Generate a unique ID for the discount if not provided
         if "id" not in discount_data:
-            current_date = datetime.now().strftime("%Y%m%d")
-            random_suffix = uuid.uuid4().hex[:8]
-            discount_data["id"] = f"disc-{current_date}-{random_suffix}"
+            discount_data["id"] = generate_unique_id("disc")
         
         # Add timestamps
         discount_data["created_at"] = datetime.now().isoformat()
         
         # Insert into database
-        result = await db.discounts.insert_one(discount_data)
+        collection = await get_collection("discounts")
+        result = await collection.insert_one(discount_data)
+        _discount_cache.pop(discount_data["code"])
         
         # Get the newly created discount
         created_discount = await get_discount_by_id(discount_data["id"])
@@ -433,13 +542,15 @@ async def update_discount(discount_id: str, updates: Dict[str, Any]) -> Optional
         updates["updated_at"] = datetime.now().isoformat()
         
         # Update the discount
-        result = await db.discounts.update_one(
+        collection = await get_collection("discounts")
+        result = await collection.update_one(
             {"id": discount_id}, 
             {"$set": updates}
         )
         
         if result.matched_count == 0:
             return None
+        _discount_cache.clear()
         
         # Get the updated discount
         updated_discount = await get_discount_by_id(discount_id)
@@ -460,30 +571,71 @@ async def delete_discount(discount_id: str) -> bool:
         True if deleted, False if not found
     """
     try:
-        result = await db.discounts.delete_one({"id": discount_id})
+        collection = await get_collection("discounts")
+        result = await collection.delete_one({"id": discount_id})
+        if result.deleted_count > 0:
+            _discount_cache.clear()
         return result.deleted_count > 0
     
     except Exception as e:
         logger.error(f"Error deleting discount {discount_id}: {str(e)}")
         raise
 
-async def increment_discount_usage(code: str) -> bool:
+async def claim_discount(code: str) -> Optional[Dict[str, Any]]:
     """
-    Increment the usage count for a discount code.
+    Atomically use up one redemption of a discount code.
+    
+    The active flag, validity window and usage limit are checked by the
+    same update that increments current_uses, so concurrent bookings
+    cannot push a code past max_uses.
     
     Args:
         code: The discount code
         
     Returns:
-        True if updated, False if not found
+        Discount data as it was before the increment, or None if the code
+        does not exist or cannot be used right now
     """
     try:
-        result = await db.discounts.update_one(
-            {"code": code},
-            {"$inc": {"current_uses": 1}}
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        collection = await get_collection("discounts")
+        discount = await collection.find_one_and_update(
+            {
+                "code": code,
+                "is_active": True,
+                "start_date": {"$lte": current_date},
+                "end_date": {"$gte": current_date},
+                "$or": [
+                    # A missing, null or zero max_uses means unlimited
+                    {"max_uses": {"$in": [None, 0]}},
+                    {"$expr": {"$lt": [{"$ifNull": ["$current_uses", 0]}, "$max_uses"]}}
+                ]
+            },
+            {"$inc": {"current_uses": 1}},
+            return_document=ReturnDocument.BEFORE
         )
-        return result.matched_count > 0
+        
+        if discount:
+            # current_uses changed, so a cached copy would be stale
+            _discount_cache.pop(code)
+            discount["id"] = discount.get("id", str(discount.get("_id", "")))
+            if "_id" in discount:
+                del discount["_id"]
+        
+        return discount
     
     except Exception as e:
-        logger.error(f"Error incrementing usage for discount code {code}: {str(e)}")
+        logger.error(f"Error claiming discount code {code}: {str(e)}")
         raise
+
+async def increment_discount_usage(code: str) -> bool:
+    """
+    Increment the usage count for a discount code.
+    
+    Args:
+        code: The discount code
+        
+    Returns:
+        True if updated, False if not found or no longer usable
+    """
+    return await claim_discount(code) is not None
@@ -11,6 +11,10 @@ from datetime import datetime
 from app.core.security import get_password_hash, verify_password
 from app.db.mongodb import get_collection
 
+# Projection for user documents returned to callers: the password hash
+# is never needed there, so leave it on the server
+PUBLIC_USER_PROJECTION = {"hashed_password": 0}
+
 class UserModel:
     collection_name = "users"
     
@@ -85,13 +89,10 @@ class UserModel:
         result = await users_collection.find_one_and_update(
             {"_id": ObjectId(user_id)},
             {"$set": update_data},
+            projection=PUBLIC_USER_PROJECTION,
             return_document=True
         )
         
-        if result:
-            # Remove hashed_password from return value
-            result.pop("hashed_password", None)
-        
         return result
     
     @classmethod
@@ -115,14 +116,8 @@ class UserModel:
         users_collection = await cls.get_collection()
         
         query = filters or {}
-        cursor = users_collection.find(query).skip(skip).limit(limit)
-        users = await cursor.to_list(length=limit)
-        
-        # Remove hashed_password from all users
-        for user in users:
-            user.pop("hashed_password", None)
-            
-        return users
+        cursor = users_collection.find(query, PUBLIC_USER_PROJECTION).skip(skip).limit(limit)
+        return await cursor.to_list(length=limit)
     
     @classmethod
     async def count_users(cls, filters: Dict[str, Any] = None) -> int:
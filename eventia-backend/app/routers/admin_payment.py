@@ -5,19 +5,23 @@ Routes for managing payment settings in the admin panel
 """
 
 import os
+import aiofiles
+from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, status
+from fastapi import APIRouter, HTTPException, Depends, Response, UploadFile, File, Form, status
 from fastapi.responses import JSONResponse
 
 from app.config import settings
 from app.utils.logger import logger
+from app.utils.json_utils import ORJSONRoute, orjson_dumps
 from app.schemas.settings import PaymentSettingsBase, PaymentSettingsUpdate, PaymentSettingsResponse
 from app.middleware.auth import get_admin_user
 
 router = APIRouter(
     prefix="/admin/payment-settings",
     tags=["Admin Payment Settings"],
-    dependencies=[Depends(get_admin_user)]
+    dependencies=[Depends(get_admin_user)],
+    route_class=ORJSONRoute
 )
 
 # In-memory store until database setup
@@ -32,6 +36,28 @@ _payment_settings = PaymentSettingsResponse(
     updated_at=""
 )
 
+# Serialized _payment_settings served by the settings endpoints; rebuilt
+# by the admin routes right after each write so readers never rebuild it
+_payment_settings_body: Optional[bytes] = None
+
+
+def get_payment_settings_body() -> bytes:
+    """
+    Get the JSON body for the current payment settings
+    
+    Returns:
+        Cached serialized settings
+    """
+    if _payment_settings_body is None:
+        _refresh_payment_settings_body()
+    return _payment_settings_body
+
+
+def _refresh_payment_settings_body() -> None:
+    """Re-serialize the settings after a write"""
+    global _payment_settings_body
+    _payment_settings_body = orjson_dumps(_payment_settings)
+
 
 @router.get("", response_model=PaymentSettingsResponse)
 async def get_payment_settings():
@@ -39,7 +65,9 @@ async def get_payment_settings():
     try:
         # In a real implementation, would fetch from database
         logger.info("Fetching payment settings")
-        return _payment_settings
+        # Serve the body cached since the last update instead of
+        # re-validating and re-serializing the model on every call
+        return Response(content=get_payment_settings_body(), media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching payment settings: {str(e)}")
         raise HTTPException(
@@ -64,8 +92,8 @@ async def update_payment_settings(settings_update: PaymentSettingsUpdate):
             _payment_settings.vpaAddress = _payment_settings.vpa
         
         # Update timestamp
-        from datetime import datetime
         _payment_settings.updated_at = datetime.now().isoformat()
+        _refresh_payment_settings_body()
         
         logger.info("Payment settings updated")
         return _payment_settings
@@ -103,14 +131,15 @@ async def upload_qr_image(
         file_path = settings.static_payments_path / filename
         
         # Save the uploaded file
-        with open(file_path, "wb+") as file_object:
-            file_object.write(await qr_image.read())
+        async with aiofiles.open(file_path, "wb+") as file_object:
+            await file_object.write(await qr_image.read())
         
         # Update payment settings
         _payment_settings.qrImageUrl = f"/static/payments/{filename}"
         _payment_settings.payment_mode = payment_mode
         _payment_settings.isPaymentEnabled = isPaymentEnabled
         _payment_settings.updated_at = datetime.now().isoformat()
+        _refresh_payment_settings_body()
         
         logger.info(f"Payment QR image uploaded: {file_path}")
         return _payment_settings
@@ -133,6 +162,7 @@ async def toggle_payment_status(isEnabled: bool):
         # Update payment enabled status
         _payment_settings.isPaymentEnabled = isEnabled
         _payment_settings.updated_at = datetime.now().isoformat()
+        _refresh_payment_settings_body()
         
         logger.info(f"Payment status toggled: {isEnabled}")
         return _payment_settings
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from typing import Dict, Any
 from ..controllers.analytics_controller import get_analytics, get_revenue_analytics, get_events_performance
+from ..middleware.auth import require_admin_token
 
 router = APIRouter(
     prefix="/analytics",
     tags=["analytics"],
     responses={404: {"description": "Not found"}},
+    dependencies=[Depends(require_admin_token)],
 )
 
 
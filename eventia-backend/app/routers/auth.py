@@ -4,7 +4,7 @@ Authentication Router
 API endpoints for user authentication
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import EmailStr
 
@@ -18,6 +18,7 @@ from app.controllers.auth import (
     reset_password,
     oauth2_scheme
 )
+from app.utils.json_utils import ORJSONRoute
 from app.schemas.users import (
     UserCreate,
     UserResponse,
@@ -26,7 +27,21 @@ from app.schemas.users import (
     PasswordReset
 )
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=ORJSONRoute)
+
+# Static tail of the token response body; only the token itself varies
+_TOKEN_RESPONSE_TAIL = b'","token_type":"bearer"}'
+
+
+def _token_response(access_token: str) -> Response:
+    """
+    Build the login response body from a pre-serialized template
+    
+    JWTs only contain base64url characters and dots, so the token can be
+    spliced in without JSON escaping.
+    """
+    body = b'{"access_token":"' + access_token.encode() + _TOKEN_RESPONSE_TAIL
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -47,7 +62,7 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
         )
     
     access_token = create_access_token(str(user.id))
-    return {"access_token": access_token, "token_type": "bearer"}
+    return _token_response(access_token)
 
 
 @router.post("/json-login", response_model=Token)
@@ -61,7 +76,7 @@ async def json_login(user_credentials: UserLogin):
         )
     
     access_token = create_access_token(str(user.id))
-    return {"access_token": access_token, "token_type": "bearer"}
+    return _token_response(access_token)
 
 
 @router.get("/me", response_model=UserResponse)
@@ -17,12 +17,14 @@ from ..schemas.bookings import (
 )
 from ..controllers.booking_controller import BookingController
 from ..utils.logger import logger
+from ..utils.json_utils import ORJSONRoute
 
 # Create router
 router = APIRouter(
     prefix="/bookings",
     tags=["bookings"],
     responses={404: {"description": "Not found"}},
+    route_class=ORJSONRoute,
 )
 
 
@@ -43,19 +45,10 @@ async def create_booking(
         # Create booking using controller
         created_booking = await BookingController.create_booking(booking)
 
-        # Return response
-        return {
-            "booking_id": created_booking["booking_id"],
-            "event_id": created_booking["event_id"],
-            "customer_info": created_booking["customer_info"],
-            "selected_tickets": created_booking["selected_tickets"],
-            "status": created_booking["status"],
-            "total_amount": created_booking["total_amount"],
-            "payment_verified": created_booking["payment_verified"],
-            "created_at": created_booking["created_at"],
-            "updated_at": created_booking["updated_at"],
-            "message": "Booking created successfully"
-        }
+        # The controller already builds the response payload; annotate it
+        # in place rather than copying it field by field into a new dict
+        created_booking["message"] = "Booking created successfully"
+        return created_booking
 
     except ValidationError as e:
         logger.error(f"Validation error in create_booking: {str(e)}")
@@ -5,7 +5,7 @@ API endpoints for events
 """
 
 from typing import Optional, List
-from fastapi import APIRouter, Depends, Query, Path, HTTPException
+from fastapi import APIRouter, Depends, Query, Path, HTTPException, Response
 from fastapi import status as http_status
 from pydantic import ValidationError
 from datetime import datetime
@@ -21,12 +21,15 @@ from ..schemas.event import (
 from ..controllers.event_controller import EventController
 from ..middleware.auth import get_current_user, get_admin_user
 from ..utils.logger import logger
+from ..utils.json_utils import ORJSONRoute
+from ..utils.cache import set_public_cache
 
 # Create router
 router = APIRouter(
     prefix="/events",
     tags=["events"],
     responses={404: {"description": "Not found"}},
+    route_class=ORJSONRoute,
 )
 
 
@@ -37,6 +40,7 @@ router = APIRouter(
     description="Get a list of events with optional filtering and pagination"
 )
 async def get_events(
+    response: Response,
     category: Optional[str] = Query(None, description="Filter by category"),
     featured: Optional[bool] = Query(None, description="Filter by featured status"),
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -65,6 +69,9 @@ async def get_events(
         # Get events from controller
         events = await EventController.get_events(params)
         
+        # Listings change rarely; let browsers and CDNs reuse them briefly
+        set_public_cache(response)
+        
         # Return response
         return events
     
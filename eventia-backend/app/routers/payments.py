@@ -5,11 +5,14 @@ API endpoints for payments
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import ValidationError
 
 from ..schemas.settings import PaymentSettingsResponse
+from .admin_payment import get_payment_settings_body
 from ..utils.logger import logger
+from ..utils.json_utils import ORJSONRoute
+from ..utils.cache import PUBLIC_CACHE_CONTROL
 from ..config import settings
 
 # Create router
@@ -17,6 +20,7 @@ router = APIRouter(
     prefix="/payments",
     tags=["payments"],
     responses={404: {"description": "Not found"}},
+    route_class=ORJSONRoute,
 )
 
 
@@ -32,11 +36,13 @@ async def get_payment_settings():
     """
     try:
         # In a real implementation, this would fetch from database
-        # For now, we'll use the same in-memory store as the admin payment router
-        from ..routers.admin_payment import _payment_settings
-        
-        # Return response
-        return _payment_settings
+        # For now, we'll use the same in-memory store as the admin payment router,
+        # served from its cached serialized body
+        return Response(
+            content=get_payment_settings_body(),
+            media_type="application/json",
+            headers={"Cache-Control": PUBLIC_CACHE_CONTROL}
+        )
     
     except Exception as e:
         logger.error(f"Error in get_payment_settings: {str(e)}")
@@ -22,6 +22,7 @@ from ..schemas.seat import (
 from ..controllers.seat_controller import SeatController
 from ..middleware.auth import get_current_user, get_admin_user
 from ..utils.logger import logger
+from ..utils.json_utils import ORJSONRoute
 from ..websockets.connection_manager import ConnectionManager
 
 # Create router
@@ -29,6 +30,7 @@ router = APIRouter(
     prefix="/seats",
     tags=["seats"],
     responses={404: {"description": "Not found"}},
+    route_class=ORJSONRoute,
 )
 
 # WebSocket connection manager
@@ -296,9 +298,10 @@ async def reserve_seats(
         # Reserve seats using controller
         result = await SeatController.reserve_seats(reservation_data)
         
-        # Broadcast seat reservations to connected clients
+        # Broadcast seat reservations to connected clients; the manager
+        # coalesces them into one frame per stadium
         for seat in result["reserved_seats"]:
-            await connection_manager.broadcast_to_stadium(
+            connection_manager.queue_stadium_update(
                 seat["stadium_id"],
                 {
                     "type": "seat_reserved",
@@ -364,6 +367,11 @@ async def release_seats(
 async def websocket_endpoint(websocket: WebSocket, stadium_id: str):
     """
     WebSocket endpoint for real-time seat updates
+    
+    Besides the replies to ping/get_seats, clients receive seat_updated
+    and seat_reserved messages. Bursts of updates arrive as one
+    {"type": "batch", "updates": [...]} frame whose entries are handled
+    like individual messages (see ConnectionManager.queue_stadium_update).
     """
     try:
         # Accept the connection
@@ -5,7 +5,8 @@ API endpoints for stadium operations
 """
 
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, Query, Path, HTTPException, status, File, UploadFile, Form
+import aiofiles
+from fastapi import APIRouter, Depends, Query, Path, HTTPException, Response, status, File, UploadFile, Form
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
@@ -23,6 +24,8 @@ from ..schemas.stadium import (
 from ..controllers.stadium_controller import StadiumController
 from ..middleware.auth import get_current_user, get_admin_user
 from ..utils.logger import logger
+from ..utils.json_utils import ORJSONRoute
+from ..utils.cache import set_public_cache
 from ..utils.file import save_upload_file
 from ..config import settings
 
@@ -31,6 +34,7 @@ router = APIRouter(
     prefix="/stadiums",
     tags=["stadiums"],
     responses={404: {"description": "Not found"}},
+    route_class=ORJSONRoute,
 )
 
 
@@ -41,6 +45,7 @@ router = APIRouter(
     description="Get a list of stadiums with optional filtering and pagination"
 )
 async def get_stadiums(
+    response: Response,
     search: Optional[str] = Query(None, description="Search by name or location"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
@@ -63,6 +68,9 @@ async def get_stadiums(
         # Get stadiums from controller
         stadiums = await StadiumController.get_stadiums(params)
         
+        # Listings change rarely; let browsers and CDNs reuse them briefly
+        set_public_cache(response)
+        
         # Return response
         return stadiums
     
@@ -224,9 +232,9 @@ async def upload_stadium_image(
         filepath = settings.STATIC_STADIUMS_PATH / filename
         
         # Save file
-        async with open(filepath, 'wb') as buffer:
+        async with aiofiles.open(filepath, 'wb') as buffer:
             content = await file.read()
-            buffer.write(content)
+            await buffer.write(content)
         
         # Update stadium with new image URL
         image_url = f"{settings.STATIC_URL}/stadiums/{filename}"
@@ -291,9 +299,9 @@ async def upload_stadium_map(
         filepath = settings.STATIC_STADIUMS_PATH / filename
         
         # Save file
-        async with open(filepath, 'wb') as buffer:
+        async with aiofiles.open(filepath, 'wb') as buffer:
             content = await file.read()
-            buffer.write(content)
+            await buffer.write(content)
         
         # Update stadium with new map URL
         map_url = f"{settings.STATIC_URL}/stadiums/{filename}"
@@ -479,9 +487,9 @@ async def upload_section_image(
         filepath = settings.STATIC_STADIUMS_PATH / filename
         
         # Save file
-        async with open(filepath, 'wb') as buffer:
+        async with aiofiles.open(filepath, 'wb') as buffer:
             content = await file.read()
-            buffer.write(content)
+            await buffer.write(content)
         
         # Update section with new image URL
         view_image_url = f"{settings.STATIC_URL}/stadiums/{filename}"
@@ -5,6 +5,7 @@ API endpoints for teams
 """
 
 from typing import Optional, List
+import aiofiles
 from fastapi import APIRouter, Depends, Query, Path, HTTPException, status, File, UploadFile
 from pydantic import ValidationError
 
@@ -219,9 +220,9 @@ async def upload_team_logo(
         filepath = settings.STATIC_TEAMS_PATH / filename
         
         # Save file
-        async with open(filepath, 'wb') as buffer:
+        async with aiofiles.open(filepath, 'wb') as buffer:
             content = await file.read()
-            buffer.write(content)
+            await buffer.write(content)
         
         # Update team with new logo URL
         logo_url = f"{settings.STATIC_URL}/teams/{filename}"
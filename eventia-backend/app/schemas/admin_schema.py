@@ -3,13 +3,15 @@ from typing import Optional
 from datetime import datetime
 import re
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+
 class AdminBase(BaseModel):
     username: str
     email: str
     
     @validator('email')
     def validate_email(cls, v):
-        if not re.match(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$', v):
+        if not _EMAIL_RE.match(v):
             raise ValueError('Invalid email format')
         return v
 
@@ -10,6 +10,9 @@ from typing import List, Optional
 import re
 from app.config.constants import BookingStatus
 
+_PHONE_RE = re.compile(r'^\+?[0-9]{10,15}$')
+_UTR_RE = re.compile(r'^[A-Za-z0-9]{10,23}$')
+
 class SelectedTicket(BaseModel):
     ticket_type_id: str
     quantity: int
@@ -22,7 +25,7 @@ class CustomerInfo(BaseModel):
 
     @validator('phone')
     def validate_phone(cls, value):
-        if not re.match(r'^\+?[0-9]{10,15}$', value):
+        if not _PHONE_RE.match(value):
             raise ValueError('Invalid phone number format')
         return value
 
@@ -98,7 +101,7 @@ class UTRSubmissionSchema(BaseModel):
     @validator('utr')
     def validate_utr(cls, value):
         """Validate UTR format."""
-        if not re.match(r'^[A-Za-z0-9]{10,23}$', value):
+        if not _UTR_RE.match(value):
             raise ValueError('Invalid UTR format. Please enter the correct UTR number from your payment confirmation.')
         return value
 
@@ -9,6 +9,8 @@ from datetime import datetime
 import re
 from app.config.constants import PaymentMode
 
+_VPA_RE = re.compile(r'^[a-zA-Z0-9.\-_]{2,256}@[a-zA-Z]{2,64}$')
+
 class PaymentSettingsSchema(Schema):
     """Schema for payment settings."""
     merchant_name = fields.Str(required=True)
@@ -21,7 +23,7 @@ class PaymentSettingsSchema(Schema):
     @validates('vpa')
     def validate_vpa(self, value):
         """Validate VPA format."""
-        if not re.match(r'^[a-zA-Z0-9.\-_]{2,256}@[a-zA-Z]{2,64}$', value):
+        if not _VPA_RE.match(value):
             raise ValidationError('Invalid VPA format. Should be in the format username@provider')
 
 class PaymentSettingsResponseSchema(Schema):
@@ -45,7 +47,7 @@ class PaymentSettingsUpdateSchema(Schema):
     @validates('vpa')
     def validate_vpa(self, value):
         """Validate VPA format."""
-        if not re.match(r'^[a-zA-Z0-9.\-_]{2,256}@[a-zA-Z]{2,64}$', value):
+        if not _VPA_RE.match(value):
             raise ValidationError('Invalid VPA format. Should be in the format username@provider')
     
     @post_load
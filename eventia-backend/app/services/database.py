@@ -4,30 +4,84 @@ Database service
 A service class for interacting with MongoDB database
 """
 
+import asyncio
 from typing import List, Dict, Any, Optional, Union, Tuple
-from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, DESCENDING
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCursor
+from pymongo import ASCENDING, DESCENDING, IndexModel, InsertOne, UpdateOne, UpdateMany, DeleteOne, DeleteMany
 
 from ..config import settings
 from ..utils.logger import logger
 
 
+# Indexes backing the hot list, booking and analytics queries: (collection, keys, options)
+INDEXES: List[Tuple[str, List[Tuple[str, int]], Dict[str, Any]]] = [
+    ("bookings", [("booking_date", -1)], {}),
+    ("bookings", [("discount_code", 1), ("status", 1)], {}),
+    ("bookings", [("booking_id", 1)], {"unique": True, "sparse": True}),
+    ("bookings", [("status", 1), ("booking_date", -1)], {}),
+    # Per-event booking lookups, optionally narrowed by status; also serves
+    # event_id-only queries as a prefix
+    ("bookings", [("event_id", 1), ("status", 1)], {}),
+    # Revenue analytics match on payment_status
+    ("bookings", [("payment_status", 1), ("booking_date", -1)], {}),
+    # TTL: MongoDB deletes unpaid bookings once expires_at has passed; the
+    # partial filter keeps any booking that has left payment_pending safe
+    # even if its expires_at was not cleared
+    ("bookings", [("expires_at", 1)], {
+        "expireAfterSeconds": 0,
+        "partialFilterExpression": {"status": "payment_pending"}
+    }),
+    # Discount lookups by code, and active discounts by expiry
+    ("discounts", [("code", 1)], {"unique": True}),
+    ("discounts", [("is_active", 1), ("end_date", 1)], {}),
+    # GET /events filters on featured/category and sorts by start_date
+    ("events", [("featured", 1), ("category", 1), ("start_date", 1)], {}),
+    ("events", [("category", 1), ("start_date", 1)], {}),
+    # GET /stadiums sorts by name
+    ("stadiums", [("name", 1)], {}),
+    # GET /seats filters by stadium/section/status and sorts by row
+    ("seats", [("stadium_id", 1), ("section_id", 1), ("status", 1), ("row", 1)], {}),
+]
+
+
 class Database:
     """Database service for MongoDB operations"""
     
     _client = None
     _db = None
+    # Created on first use: before Python 3.10 a Lock binds the event loop
+    # current at construction, which at import time is not uvicorn's loop
+    _lock: Optional[asyncio.Lock] = None
+    
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        """Get the init lock, creating it inside the running event loop"""
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
     
     @classmethod
     async def get_client(cls) -> AsyncIOMotorClient:
         """Get MongoDB client (create if it doesn't exist)"""
         if cls._client is None:
-            try:
-                cls._client = AsyncIOMotorClient(settings.MONGODB_URL)
-                logger.info(f"Connected to MongoDB at {settings.MONGODB_URL}")
-            except Exception as e:
-                logger.error(f"Error connecting to MongoDB: {str(e)}")
-                raise e
+            async with cls._get_lock():
+                # Another task may have created the client while we waited
+                if cls._client is None:
+                    try:
+                        # One pooled client is shared by the whole process
+                        cls._client = AsyncIOMotorClient(
+                            settings.MONGODB_URL,
+                            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+                            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+                            waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+                            serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                            retryWrites=True
+                        )
+                        logger.info(f"Connected to MongoDB at {settings.MONGODB_URL}")
+                    except Exception as e:
+                        logger.error(f"Error connecting to MongoDB: {str(e)}")
+                        raise e
         return cls._client
     
     @classmethod
@@ -35,10 +89,22 @@ class Database:
         """Get database instance"""
         if cls._db is None:
             client = await cls.get_client()
-            cls._db = client[settings.MONGODB_DB]
-            logger.info(f"Using database: {settings.MONGODB_DB}")
+            async with cls._get_lock():
+                if cls._db is None:
+                    cls._db = client[settings.MONGODB_DB]
+                    logger.info(f"Using database: {settings.MONGODB_DB}")
         return cls._db
     
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared MongoDB client"""
+        if cls._client is not None:
+            cls._client.close()
+            cls._client = None
+            cls._db = None
+            cls._lock = None
+            logger.info("MongoDB connection closed")
+    
     @classmethod
     async def get_collection(cls, collection_name: str):
         """Get a collection by name"""
@@ -46,16 +112,17 @@ class Database:
         return db[collection_name]
     
     @classmethod
-    async def find(
+    async def find_cursor(
         cls, 
         collection_name: str, 
         query: Dict[str, Any], 
         projection: Dict[str, Any] = None,
         skip: int = 0,
         limit: int = 0,
-        sort: List[Tuple[str, int]] = None
-    ) -> List[Dict[str, Any]]:
-        """Find documents in a collection"""
+        sort: List[Tuple[str, int]] = None,
+        batch_size: int = 0
+    ) -> AsyncIOMotorCursor:
+        """Build a cursor over documents in a collection without fetching them"""
         collection = await cls.get_collection(collection_name)
         cursor = collection.find(query, projection)
         
@@ -69,7 +136,23 @@ class Database:
                 sort_direction = ASCENDING if direction == 1 else DESCENDING
                 sort_list.append((field, sort_direction))
             cursor = cursor.sort(sort_list)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
         
+        return cursor
+    
+    @classmethod
+    async def find(
+        cls, 
+        collection_name: str, 
+        query: Dict[str, Any], 
+        projection: Dict[str, Any] = None,
+        skip: int = 0,
+        limit: int = 0,
+        sort: List[Tuple[str, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Find documents in a collection"""
+        cursor = await cls.find_cursor(collection_name, query, projection, skip, limit, sort)
         return await cursor.to_list(length=None)
     
     @classmethod
@@ -97,10 +180,32 @@ class Database:
         return result.acknowledged
     
     @classmethod
-    async def insert_many(cls, collection_name: str, documents: List[Dict[str, Any]]) -> bool:
-        """Insert multiple documents into a collection"""
+    async def insert_many(
+        cls, 
+        collection_name: str, 
+        documents: List[Dict[str, Any]],
+        ordered: bool = False,
+        bypass_document_validation: bool = False
+    ) -> bool:
+        """Insert multiple documents into a collection (unordered by default)"""
+        collection = await cls.get_collection(collection_name)
+        result = await collection.insert_many(
+            documents,
+            ordered=ordered,
+            bypass_document_validation=bypass_document_validation
+        )
+        return result.acknowledged
+    
+    @classmethod
+    async def bulk_write(
+        cls, 
+        collection_name: str, 
+        operations: List[Union[InsertOne, UpdateOne, UpdateMany, DeleteOne, DeleteMany]],
+        ordered: bool = False
+    ) -> bool:
+        """Run a batch of mixed write operations in a single round trip"""
         collection = await cls.get_collection(collection_name)
-        result = await collection.insert_many(documents)
+        result = await collection.bulk_write(operations, ordered=ordered)
         return result.acknowledged
     
     @classmethod
@@ -160,4 +265,31 @@ class Database:
             sort_direction = ASCENDING if direction == 1 else DESCENDING
             index_keys.append((field, sort_direction))
             
-        return await collection.create_index(index_keys, **kwargs)
\ No newline at end of file
+        return await collection.create_index(index_keys, **kwargs)
+    
+    @classmethod
+    async def ensure_indexes(cls) -> None:
+        """
+        Create the indexes in INDEXES (a no-op for indexes that already exist)
+        
+        Indexes are sent as one createIndexes command per collection rather
+        than one command per index, and only for indexes that a listIndexes
+        probe does not already find, so a warm startup creates nothing.
+        """
+        index_models: Dict[str, List[IndexModel]] = {}
+        for collection_name, keys, options in INDEXES:
+            # Pre-4.2 servers otherwise build non-unique indexes in the
+            # foreground, holding the collection lock; 4.2+ ignores the option
+            if not options.get("unique"):
+                options = {"background": True, **options}
+            index_models.setdefault(collection_name, []).append(IndexModel(keys, **options))
+        
+        for collection_name, models in index_models.items():
+            collection = await cls.get_collection(collection_name)
+            existing_names = {index["name"] async for index in collection.list_indexes()}
+            missing = [model for model in models if model.document["name"] not in existing_names]
+            if not missing:
+                continue
+            
+            index_names = await collection.create_indexes(missing)
+            logger.info(f"Created indexes {', '.join(index_names)} on {collection_name}")
@@ -0,0 +1,111 @@
+"""
+Cache Utilities
+-------------------
+Helpers for cache headers on public, slow-changing endpoints, and a small
+in-process TTL cache
+"""
+
+import copy
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from fastapi import Response
+
+
+# Defaults for public listings: fresh for 30s, then served stale for up to
+# 60s more while the browser or CDN revalidates in the background
+PUBLIC_MAX_AGE = 30
+PUBLIC_STALE_WHILE_REVALIDATE = 60
+
+
+def public_cache_control(
+    max_age: int = PUBLIC_MAX_AGE,
+    stale_while_revalidate: int = PUBLIC_STALE_WHILE_REVALIDATE
+) -> str:
+    """
+    Build a Cache-Control value for publicly cacheable responses
+
+    Args:
+        max_age: Seconds the response is considered fresh
+        stale_while_revalidate: Seconds a stale response may be served while revalidating
+
+    Returns:
+        Cache-Control header value
+    """
+    return f"public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}"
+
+
+# Header value for the default settings, built once
+PUBLIC_CACHE_CONTROL = public_cache_control()
+
+
+def set_public_cache(response: Response, cache_control: str = PUBLIC_CACHE_CONTROL) -> None:
+    """
+    Mark a response as publicly cacheable
+
+    Args:
+        response: Response to add the Cache-Control header to
+        cache_control: Header value, defaults to PUBLIC_CACHE_CONTROL
+    """
+    response.headers["Cache-Control"] = cache_control
+
+
+class TTLCache:
+    """
+    Small in-process cache whose entries expire after a fixed number of seconds
+    
+    Once maxsize entries are held the oldest one is evicted. Values are
+    copied on the way in and out, so callers may mutate what they get back
+    without affecting the cached entry.
+    """
+    
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (monotonic time the entry expires, value)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a live entry
+        
+        Args:
+            key: Cache key
+            default: Returned when the key is missing or expired
+            
+        Returns:
+            A copy of the cached value, or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() >= entry[0]:
+            del self._entries[key]
+            return default
+        return copy.deepcopy(entry[1])
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store an entry
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds to keep this entry, capped at the cache's own ttl
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        
+        # Evict the oldest entry (dicts keep insertion order) when full
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+    
+    def pop(self, key: Hashable) -> None:
+        """Drop an entry if present"""
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
@@ -5,6 +5,7 @@ Utilities for file operations
 """
 
 import os
+import aiofiles
 from pathlib import Path
 from typing import Optional
 
@@ -105,8 +106,8 @@ async def save_upload_file(upload_file, folder: str, filename: Optional[str] = N
         
         # Save the file
         contents = await upload_file.read()
-        with open(file_path, "wb") as f:
-            f.write(contents)
+        async with aiofiles.open(file_path, "wb") as f:
+            await f.write(contents)
         
         # Return relative URL path
         return f"{folder}/{filename}"
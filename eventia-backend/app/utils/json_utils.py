@@ -5,9 +5,52 @@ Utilities for JSON serialization/deserialization
 """
 
 import json
+import orjson
 from datetime import datetime, date, time
 from bson import ObjectId
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Optional, Union
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+
+# Serializer per concrete type, so the isinstance/hasattr probes run once per type
+_SERIALIZER_CACHE: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _resolve_serializer(obj_type: type) -> Optional[Callable[[Any], Any]]:
+    """
+    Work out how to serialize instances of a type
+    
+    Args:
+        obj_type: Type to inspect
+    
+    Returns:
+        Serializer function, or None if the type is not supported
+    """
+    if issubclass(obj_type, (datetime, date, time)):
+        return obj_type.isoformat
+    if issubclass(obj_type, ObjectId):
+        return str
+    # For Pydantic v2 models with model_dump method; checked first because
+    # v2 still has a deprecated dict() that warns on every call
+    if callable(getattr(obj_type, "model_dump", None)):
+        return obj_type.model_dump
+    # For Pydantic v1 models that only have a dict method
+    if callable(getattr(obj_type, "dict", None)):
+        return obj_type.dict
+    return None
+
+
+def _get_serializer(obj: Any) -> Optional[Callable[[Any], Any]]:
+    """Get the cached serializer for an object's type"""
+    obj_type = type(obj)
+    serializer = _SERIALIZER_CACHE.get(obj_type)
+    if serializer is None:
+        serializer = _resolve_serializer(obj_type)
+        if serializer is not None:
+            _SERIALIZER_CACHE[obj_type] = serializer
+    return serializer
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -15,18 +58,9 @@ class CustomJSONEncoder(json.JSONEncoder):
     Custom JSON encoder to handle datetime objects and MongoDB ObjectIds
     """
     def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, (date, time)):
-            return obj.isoformat()
-        if isinstance(obj, ObjectId):
-            return str(obj)
-        # For Pydantic models that have a dict method
-        if hasattr(obj, "dict") and callable(getattr(obj, "dict")):
-            return obj.dict()
-        # For Pydantic v2 models with model_dump method
-        if hasattr(obj, "model_dump") and callable(getattr(obj, "model_dump")):
-            return obj.model_dump()
+        serializer = _get_serializer(obj)
+        if serializer is not None:
+            return serializer(obj)
         return super().default(obj)
 
 
@@ -40,17 +74,26 @@ def json_serializer(obj: Any) -> Any:
     Returns:
         JSON serializable object
     """
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if isinstance(obj, (date, time)):
-        return obj.isoformat()
-    if isinstance(obj, ObjectId):
-        return str(obj)
-    if hasattr(obj, "dict") and callable(getattr(obj, "dict")):
-        return obj.dict()
-    if hasattr(obj, "model_dump") and callable(getattr(obj, "model_dump")):
-        return obj.model_dump()
-    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    serializer = _get_serializer(obj)
+    if serializer is None:
+        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    return serializer(obj)
+
+
+def orjson_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes using orjson
+    
+    orjson handles datetime, date, time and UUID natively; anything else
+    (ObjectId, Pydantic models) goes through json_serializer.
+    
+    Args:
+        obj: Object to serialize
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, default=json_serializer, option=orjson.OPT_NON_STR_KEYS)
 
 
 def serialize_dict(data: Dict) -> Dict:
@@ -59,6 +102,12 @@ def serialize_dict(data: Dict) -> Dict:
     This handles nested dictionaries, lists, and special types like 
     datetime and ObjectId.
     
+    The structure is walked by orjson in a single dumps/loads round trip
+    rather than recursively in Python. orjson.loads also reuses a single
+    str object for repeated short keys ("event_id", "status", ...), so
+    large lists of documents share their key strings without a separate
+    interning pass.
+    
     Args:
         data: Dictionary to serialize
     
@@ -67,23 +116,67 @@ def serialize_dict(data: Dict) -> Dict:
     """
     if data is None:
         return None
-        
-    result = {}
+    
+    return orjson.loads(orjson_dumps(data))
+
+
+def stringify_object_ids(data: Dict) -> Dict:
+    """
+    Convert top-level ObjectId values (and lists of them) to strings in place
+    
+    Cheaper than serialize_dict for documents that are validated into a
+    model next: datetimes stay native instead of being formatted and then
+    parsed back, and nothing is copied.
+    
+    Args:
+        data: MongoDB document
+    
+    Returns:
+        The same document
+    """
+    if data is None:
+        return None
+    
     for key, value in data.items():
-        if isinstance(value, dict):
-            result[key] = serialize_dict(value)
-        elif isinstance(value, list):
-            result[key] = [
-                serialize_dict(item) if isinstance(item, dict) else 
-                str(item) if isinstance(item, (datetime, date, time, ObjectId)) else item
-                for item in value
-            ]
-        elif isinstance(value, (datetime, date, time, ObjectId)):
-            result[key] = str(value)
-        elif hasattr(value, "dict") and callable(getattr(value, "dict")):
-            result[key] = value.dict()
-        elif hasattr(value, "model_dump") and callable(getattr(value, "model_dump")):
-            result[key] = value.model_dump()
-        else:
-            result[key] = value
-    return result
\ No newline at end of file
+        if isinstance(value, ObjectId):
+            data[key] = str(value)
+        elif isinstance(value, list) and value and isinstance(value[0], ObjectId):
+            data[key] = [str(item) if isinstance(item, ObjectId) else item for item in value]
+    return data
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson_dumps
+    
+    Used as the application's default response class and by the exception
+    handlers, so every JSON body goes through the same serializer.
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
+
+
+class ORJSONRequest(Request):
+    """
+    Request that decodes JSON bodies with orjson
+    """
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    API route that parses request bodies with orjson instead of stdlib json
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so malformed
+    bodies still produce the usual 422 validation response.
+    """
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+        
+        async def orjson_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+        
+        return orjson_route_handler
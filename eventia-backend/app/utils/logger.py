@@ -29,13 +29,17 @@ logger.add(
 log_dir = Path(settings.ROOT_PATH) / "logs"
 log_dir.mkdir(exist_ok=True)
 
+# File handlers write through loguru's queue (enqueue=True) so disk I/O and
+# rotation happen on a background worker instead of the request path
+
 # Add file handler for errors
 logger.add(
     log_dir / "error.log",
     format=LOG_FORMAT,
     level="ERROR",
     rotation="10 MB",
-    retention="7 days"
+    retention="7 days",
+    enqueue=True
 )
 
 # Add file handler for all logs
@@ -44,7 +48,8 @@ logger.add(
     format=LOG_FORMAT,
     level=settings.LOG_LEVEL,
     rotation="10 MB",
-    retention="7 days"
+    retention="7 days",
+    enqueue=True
 )
 
 
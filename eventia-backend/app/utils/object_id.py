@@ -5,6 +5,8 @@ Utility class for handling MongoDB ObjectId in Pydantic models
 """
 
 from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
 from pydantic import BaseModel
 
 
@@ -18,11 +20,43 @@ class PyObjectId(ObjectId):
     @classmethod
     def validate(cls, v):
         """Validate the ObjectId"""
-        if not ObjectId.is_valid(v):
+        if isinstance(v, ObjectId):
+            return v
+        # ObjectId(None) would generate a fresh id rather than fail
+        if v is None:
+            raise ValueError("Invalid ObjectId")
+        try:
+            return ObjectId(v)
+        except (InvalidId, TypeError):
             raise ValueError("Invalid ObjectId")
-        return ObjectId(v)
     
     @classmethod
     def __get_pydantic_json_schema__(cls, _schema_generator, _field):
         """Modify the schema to represent ObjectId as string - Updated for Pydantic v2"""
-        return {"type": "string"}
\ No newline at end of file
+        return {"type": "string"}
+
+
+def parse_object_id(value: str, name: str = "ID") -> ObjectId:
+    """
+    Convert a path or body ID to an ObjectId, validating it only once
+    
+    Args:
+        value: ID string to convert
+        name: What the ID refers to, used in the error message (e.g. "event ID")
+        
+    Returns:
+        The parsed ObjectId
+        
+    Raises:
+        HTTPException: If the value is not a valid ObjectId
+    """
+    # ObjectId(None) would generate a fresh id rather than fail
+    if value is not None:
+        try:
+            return ObjectId(value)
+        except (InvalidId, TypeError):
+            pass
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid {name} format"
+    )
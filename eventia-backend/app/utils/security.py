@@ -4,14 +4,21 @@ Security Utilities
 Utilities for security and token handling
 """
 
+import hmac
 import os
 import secrets
-import string
+from datetime import datetime
+
+from app.config import settings
+
+
+# Expected admin token, encoded once for constant-time comparison
+_ADMIN_TOKEN_BYTES = settings.ADMIN_TOKEN.encode()
 
 
 def generate_random_token(length: int = 32) -> str:
     """
-    Generate a secure random token
+    Generate a secure URL-safe random token
     
     Args:
         length: Length of the token (default: 32)
@@ -19,5 +26,38 @@ def generate_random_token(length: int = 32) -> str:
     Returns:
         A random token string
     """
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length)) 
\ No newline at end of file
+    return secrets.token_urlsafe(length)[:length]
+
+
+def generate_unique_id(prefix: str, length: int = 8) -> str:
+    """
+    Generate a prefixed, date-stamped unique ID (e.g. ``disc-20250418-ab12cd34``)
+    
+    The random part comes from a single ``secrets.token_hex`` call rather
+    than formatting a full UUID and slicing it.
+    
+    Args:
+        prefix: ID prefix such as ``disc`` or ``BK``
+        length: Number of random hex characters (default: 8)
+        
+    Returns:
+        A unique ID string
+    """
+    random_part = secrets.token_hex((length + 1) // 2)[:length]
+    return f"{prefix}-{datetime.now().strftime('%Y%m%d')}-{random_part}"
+
+
+def verify_admin_token(token: str) -> bool:
+    """
+    Check a presented admin token against the configured ADMIN_TOKEN
+    
+    Uses hmac.compare_digest so the comparison time does not depend on
+    how many leading characters match.
+    
+    Args:
+        token: Token presented by the client
+        
+    Returns:
+        True if the token matches, False otherwise
+    """
+    return hmac.compare_digest(token.encode(), _ADMIN_TOKEN_BYTES)
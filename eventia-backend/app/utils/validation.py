@@ -4,7 +4,6 @@ Schema and Database Validation Utilities
 Utilities for validating database schemas against Pydantic models
 """
 
-import logging
 from typing import Dict, List, Any, Optional, Set, Type
 from pydantic import BaseModel
 
@@ -132,20 +131,24 @@ async def validate_database_schema() -> Dict[str, ValidationResult]:
         result = await validate_collection_schema(collection_name, model_class)
         results[collection_name] = result
         
-        # Log validation result
+        # Log validation result; loguru only formats the arguments when the
+        # level is enabled
         if result.is_valid:
-            logger.info(f"✅ {result.message}")
+            logger.info("✅ {}", result.message)
         else:
-            logger.warning(f"❌ {result.message}")
+            logger.warning("❌ {}", result.message)
             
             # Log detailed issues
             if result.missing_fields:
-                logger.warning(f"   Missing fields in {collection_name}: {', '.join(result.missing_fields)}")
+                logger.warning("   Missing fields in {}: {}", collection_name, ", ".join(result.missing_fields))
             if result.extra_fields:
-                logger.info(f"   Extra fields in {collection_name}: {', '.join(result.extra_fields)}")
+                logger.info("   Extra fields in {}: {}", collection_name, ", ".join(result.extra_fields))
             if result.type_mismatches:
                 for field, mismatch in result.type_mismatches.items():
-                    logger.warning(f"   Type mismatch in {collection_name}.{field}: expected {mismatch['expected']}, got {mismatch['actual']}")
+                    logger.warning(
+                        "   Type mismatch in {}.{}: expected {}, got {}",
+                        collection_name, field, mismatch["expected"], mismatch["actual"]
+                    )
     
     return results
 
@@ -4,9 +4,24 @@ WebSocket Connection Manager
 Manages WebSocket connections for real-time updates
 """
 
-from typing import Dict, List, Any
+import asyncio
+from typing import Dict, List, Set, Any, Optional
 from fastapi import WebSocket
 from ..utils.logger import logger
+from ..utils.json_utils import orjson_dumps
+
+
+# Redis pub/sub channels used to share broadcasts between workers
+STADIUM_CHANNEL_PREFIX = "seat_updates:"
+BROADCAST_CHANNEL = "seat_updates"
+
+# How long queued updates are held so bursts go out as one frame (seconds)
+COALESCE_INTERVAL = 0.05
+
+# Reconnect attempts after the Redis listener fails, starting at the base
+# delay and doubling each time, before falling back to local delivery
+PUBSUB_RETRY_ATTEMPTS = 5
+PUBSUB_RETRY_BASE_DELAY = 1.0
 
 
 class ConnectionManager:
@@ -17,13 +32,147 @@ class ConnectionManager:
     - Connecting and disconnecting WebSocket clients
     - Grouping connections by stadium ID
     - Broadcasting messages to all clients or specific groups
+    
+    When Redis pub/sub is started, broadcasts are published to Redis and
+    every worker fans them out to its own connections, so clients receive
+    updates regardless of which worker they are connected to.
     """
     
     def __init__(self):
-        # Dictionary to store active connections grouped by stadium ID
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-        # Dictionary to track connection count for logging/monitoring
-        self.connection_count: Dict[str, int] = {}
+        # Active connections grouped by stadium ID; sets give O(1) add/remove
+        # and the per-stadium count is simply the size of the set
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # Redis client, subscription and listener task while pub/sub is running
+        self._redis = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        # Updates waiting to be coalesced, per stadium, and the task flushing them
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._flusher: Optional[asyncio.Task] = None
+    
+    async def start_pubsub(self, redis_url: Optional[str]):
+        """
+        Start relaying broadcasts through Redis pub/sub
+        
+        Without a Redis URL (or the redis package) broadcasts stay local to
+        this process.
+        
+        Args:
+            redis_url: Redis connection URL, or None to disable pub/sub
+        """
+        if not redis_url or self._listener is not None:
+            return
+        
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            logger.warning("redis is not installed; WebSocket broadcasts stay local to this worker")
+            return
+        
+        # Only switch broadcasts over to Redis once the subscription is live
+        client = aioredis.from_url(redis_url, decode_responses=True)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(BROADCAST_CHANNEL)
+        await pubsub.psubscribe(f"{STADIUM_CHANNEL_PREFIX}*")
+        
+        self._redis = client
+        self._pubsub = pubsub
+        self._listener = asyncio.create_task(self._listen())
+        logger.info("WebSocket broadcasts relayed through Redis pub/sub")
+    
+    async def stop_pubsub(self):
+        """Stop the Redis listener and close the connection"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+    
+    async def _listen(self):
+        """
+        Fan out messages published by any worker to local connections
+        
+        If the Redis connection drops, listening is retried with backoff
+        (the subscription is restored on reconnect). Once the retries are
+        exhausted pub/sub is torn down and broadcasts go back to local
+        delivery.
+        """
+        failures = 0
+        while True:
+            try:
+                async for item in self._pubsub.listen():
+                    failures = 0
+                    if item["type"] not in ("message", "pmessage"):
+                        continue
+                    
+                    try:
+                        channel = item["channel"]
+                        if channel == BROADCAST_CHANNEL:
+                            for stadium_id in list(self.active_connections.keys()):
+                                await self._send_text_to_stadium(stadium_id, item["data"])
+                        else:
+                            stadium_id = channel[len(STADIUM_CHANNEL_PREFIX):]
+                            if stadium_id in self.active_connections:
+                                await self._send_text_to_stadium(stadium_id, item["data"])
+                    except Exception as e:
+                        logger.error(f"Error relaying WebSocket broadcast from Redis: {str(e)}")
+                # listen() only returns once the subscription is gone
+                raise ConnectionError("Redis subscription closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                if failures > PUBSUB_RETRY_ATTEMPTS:
+                    logger.error(f"Redis pub/sub listener failed, falling back to local WebSocket broadcasts: {str(e)}")
+                    await self._fall_back_to_local()
+                    return
+                delay = PUBSUB_RETRY_BASE_DELAY * 2 ** (failures - 1)
+                logger.warning(f"Redis pub/sub listener error, retrying in {delay:.0f}s: {str(e)}")
+                await asyncio.sleep(delay)
+    
+    async def _fall_back_to_local(self):
+        """Stop relaying through Redis and close the connection"""
+        pubsub, client = self._pubsub, self._redis
+        self._redis = None
+        self._pubsub = None
+        self._listener = None
+        
+        for resource in (pubsub, client):
+            if resource is None:
+                continue
+            try:
+                await resource.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing Redis connection: {str(e)}")
+    
+    async def _publish(self, channel: str, payload: str) -> bool:
+        """
+        Publish a serialized message to Redis
+        
+        Args:
+            channel: Redis channel to publish to
+            payload: JSON text to publish
+            
+        Returns:
+            True if published, False if the caller should deliver locally
+        """
+        client = self._redis
+        if client is None:
+            return False
+        try:
+            await client.publish(channel, payload)
+            return True
+        except Exception as e:
+            logger.error(f"Error publishing WebSocket broadcast to Redis, delivering locally: {str(e)}")
+            return False
     
     async def connect(self, websocket: WebSocket, stadium_id: str):
         """
@@ -37,15 +186,11 @@ class ConnectionManager:
         await websocket.accept()
         
         # Add to active connections for this stadium
-        if stadium_id not in self.active_connections:
-            self.active_connections[stadium_id] = []
-            self.connection_count[stadium_id] = 0
-        
-        self.active_connections[stadium_id].append(websocket)
-        self.connection_count[stadium_id] += 1
+        connections = self.active_connections.setdefault(stadium_id, set())
+        connections.add(websocket)
         
         # Log connection
-        logger.info(f"New WebSocket connection for stadium {stadium_id}. Total connections: {self.connection_count[stadium_id]}")
+        logger.info(f"New WebSocket connection for stadium {stadium_id}. Total connections: {len(connections)}")
         
         # Send initial connection confirmation
         await websocket.send_json({
@@ -63,43 +208,60 @@ class ConnectionManager:
             stadium_id: The stadium ID associated with this connection
         """
         # Remove from active connections
-        if stadium_id in self.active_connections:
-            if websocket in self.active_connections[stadium_id]:
-                self.active_connections[stadium_id].remove(websocket)
-                self.connection_count[stadium_id] -= 1
-                
-                # Log disconnection
-                logger.info(f"WebSocket disconnected from stadium {stadium_id}. Remaining connections: {self.connection_count[stadium_id]}")
-                
-                # Clean up if no more connections for this stadium
-                if not self.active_connections[stadium_id]:
-                    del self.active_connections[stadium_id]
-                    del self.connection_count[stadium_id]
+        connections = self.active_connections.get(stadium_id)
+        if connections is not None and websocket in connections:
+            connections.discard(websocket)
+            
+            # Log disconnection
+            logger.info(f"WebSocket disconnected from stadium {stadium_id}. Remaining connections: {len(connections)}")
+            
+            # Clean up if no more connections for this stadium
+            if not connections:
+                del self.active_connections[stadium_id]
     
-    async def broadcast_to_stadium(self, stadium_id: str, message: Dict[str, Any]):
+    def queue_stadium_update(self, stadium_id: str, message: Dict[str, Any]):
         """
-        Broadcast a message to all connections for a specific stadium
+        Queue a message for a stadium to be sent with other updates in the same burst
+        
+        Messages queued within COALESCE_INTERVAL are sent as a single
+        {"type": "batch", "updates": [...]} frame; a lone message is sent as is.
         
         Args:
             stadium_id: The stadium ID to broadcast to
             message: The message to broadcast
         """
-        if stadium_id in self.active_connections:
-            # Create a list to track failed connections for cleanup
-            failed_connections = []
+        self._buffers.setdefault(stadium_id, []).append(message)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_buffers())
+    
+    async def _flush_buffers(self):
+        """Send queued updates until no more arrive"""
+        while self._buffers:
+            await asyncio.sleep(COALESCE_INTERVAL)
+            buffers, self._buffers = self._buffers, {}
             
-            # Send message to all connections for this stadium
-            for connection in self.active_connections[stadium_id]:
+            for stadium_id, updates in buffers.items():
+                message = updates[0] if len(updates) == 1 else {"type": "batch", "updates": updates}
                 try:
-                    await connection.send_json(message)
+                    await self.broadcast_to_stadium(stadium_id, message)
                 except Exception as e:
-                    # If sending fails, mark connection for removal
-                    logger.error(f"Error sending message to WebSocket: {str(e)}")
-                    failed_connections.append(connection)
-            
-            # Clean up failed connections
-            for failed in failed_connections:
-                self.disconnect(failed, stadium_id)
+                    logger.error(f"Error flushing WebSocket updates for stadium {stadium_id}: {str(e)}")
+    
+    async def broadcast_to_stadium(self, stadium_id: str, message: Dict[str, Any]):
+        """
+        Broadcast a message to all connections for a specific stadium
+        
+        Args:
+            stadium_id: The stadium ID to broadcast to
+            message: The message to broadcast
+        """
+        payload = orjson_dumps(message).decode()
+        
+        if await self._publish(f"{STADIUM_CHANNEL_PREFIX}{stadium_id}", payload):
+            return
+        
+        if stadium_id in self.active_connections:
+            await self._send_text_to_stadium(stadium_id, payload)
     
     async def broadcast_to_all(self, message: Dict[str, Any]):
         """
@@ -108,9 +270,39 @@ class ConnectionManager:
         Args:
             message: The message to broadcast
         """
+        # Serialize once and reuse the payload for every stadium
+        payload = orjson_dumps(message).decode()
+        
+        if await self._publish(BROADCAST_CHANNEL, payload):
+            return
+        
         # Broadcast to all stadiums
         for stadium_id in list(self.active_connections.keys()):
-            await self.broadcast_to_stadium(stadium_id, message)
+            await self._send_text_to_stadium(stadium_id, payload)
+    
+    async def _send_text_to_stadium(self, stadium_id: str, payload: str):
+        """
+        Send an already serialized message to all connections for a stadium
+        
+        Args:
+            stadium_id: The stadium ID to send to
+            payload: JSON text shared by every connection
+        """
+        # Snapshot the connections since they may disconnect while we await
+        connections = list(self.active_connections.get(stadium_id, ()))
+        
+        # Send to all connections concurrently so one slow client does not
+        # delay the rest
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
+        
+        # Clean up connections whose send failed
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending message to WebSocket: {str(result)}")
+                self.disconnect(connection, stadium_id)
     
     def get_connection_count(self, stadium_id: str = None) -> int:
         """
@@ -123,6 +315,6 @@ class ConnectionManager:
             Number of active connections
         """
         if stadium_id:
-            return self.connection_count.get(stadium_id, 0)
+            return len(self.active_connections.get(stadium_id, ()))
         else:
-            return sum(self.connection_count.values())
\ No newline at end of file
+            return sum(len(connections) for connections in self.active_connections.values())
\ No newline at end of file
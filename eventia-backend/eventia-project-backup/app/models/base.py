@@ -7,7 +7,7 @@ Base classes for all MongoDB models
 from typing import Any, Dict, Optional
 from datetime import datetime
 from bson import ObjectId
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_serializer
 
 
 class PyObjectId(ObjectId):
@@ -31,19 +31,25 @@ class PyObjectId(ObjectId):
 class MongoBaseModel(BaseModel):
     """Base model for MongoDB models with proper serialization configuration"""
     
-    class Config:
-        allow_population_by_field_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        json_encoders={
             ObjectId: str,
             PyObjectId: str,
             datetime: lambda v: v.isoformat()
         }
+    )
     
     id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
+    @field_serializer("id")
+    def serialize_id(self, v: ObjectId) -> str:
+        """Serialize the document id as a string"""
+        return str(v)
+    
     @classmethod
     def get_indexes(cls) -> list:
         """Return list of indexes to create for this collection"""
@@ -56,12 +62,7 @@ class MongoBaseModel(BaseModel):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dict with correct field names"""
-        data = self.model_dump(by_alias=True)
-        # Convert ObjectId to string
-        for key, value in data.items():
-            if isinstance(value, ObjectId):
-                data[key] = str(value)
-        return data
+        return self.model_dump(by_alias=True, mode="json")
     
     @classmethod
     def from_mongo(cls, data: Dict[str, Any]):
@@ -9,8 +9,8 @@ Eventia API
 Main application module for the Eventia event management platform API
 """
 
+import secrets
 import time
-import uuid
 from pathlib import Path
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -66,8 +66,8 @@ async def add_process_time_header(request: Request, call_next):
     """Add processing time and request ID headers"""
     start_time = time.time()
     
-    # Add request ID
-    request_id = str(uuid.uuid4())
+    # Add request ID (hex straight from os.urandom, no UUID object needed)
+    request_id = secrets.token_hex(16)
     request.state.request_id = request_id
     
     # Process request
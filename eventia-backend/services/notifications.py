@@ -16,6 +16,30 @@ from datetime import datetime
 
 from ..core.config import settings, logger
 
+# Display formats for supported currencies
+_CURRENCY_FMT = {
+    "INR": "₹{:,.2f}",
+    "USD": "${:,.2f}",
+    "EUR": "€{:,.2f}",
+}
+
+
+def format_currency(amount: float, currency: str = "INR") -> str:
+    """
+    Format an amount for display in notifications.
+    
+    Args:
+        amount: Amount to format
+        currency: ISO currency code (defaults to INR)
+        
+    Returns:
+        Formatted amount, e.g. ``₹7,000.00``
+    """
+    fmt = _CURRENCY_FMT.get(currency)
+    if fmt is None:
+        return f"{currency} {amount:,.2f}"
+    return fmt.format(amount)
+
 class EmailNotification:
     """
     Email notification handler class.
@@ -189,7 +213,7 @@ class EmailNotification:
                     <p><strong>Time:</strong> {event["time"]}</p>
                     <p><strong>Venue:</strong> {event["venue"]}</p>
                     <p><strong>Quantity:</strong> {booking["quantity"]}</p>
-                    <p><strong>Total Amount:</strong> ₹{booking["total_amount"]}</p>
+                    <p><strong>Total Amount:</strong> {format_currency(booking["total_amount"])}</p>
                     <p><strong>Booking Date:</strong> {formatted_booking_date}</p>
                 </div>
                 
@@ -221,7 +245,7 @@ class EmailNotification:
         Time: {event["time"]}
         Venue: {event["venue"]}
         Quantity: {booking["quantity"]}
-        Total Amount: ₹{booking["total_amount"]}
+        Total Amount: {format_currency(booking["total_amount"])}
         Booking Date: {formatted_booking_date}
         
         Your tickets will be available for download from your account once payment is verified.
@@ -289,7 +313,7 @@ class EmailNotification:
                     <h2 style="margin-top: 0; color: #00a650;">Payment Details</h2>
                     <p><strong>Booking ID:</strong> {booking["booking_id"]}</p>
                     <p><strong>Event:</strong> {event["title"]}</p>
-                    <p><strong>Total Amount Paid:</strong> ₹{booking["total_amount"]}</p>
+                    <p><strong>Total Amount Paid:</strong> {format_currency(booking["total_amount"])}</p>
                     <p><strong>Payment Method:</strong> {booking["payment_method"].upper()}</p>
                     <p><strong>Payment Status:</strong> COMPLETED</p>
                 </div>
@@ -318,7 +342,7 @@ class EmailNotification:
         Payment Details:
         Booking ID: {booking["booking_id"]}
         Event: {event["title"]}
-        Total Amount Paid: ₹{booking["total_amount"]}
+        Total Amount Paid: {format_currency(booking["total_amount"])}
         Payment Method: {booking["payment_method"].upper()}
         Payment Status: COMPLETED
         
@@ -416,7 +440,7 @@ class SMSNotification:
         message = (
             f"Booking Confirmed for {event['title']}. "
             f"Booking ID: {booking['booking_id']}. "
-            f"Amount: ₹{booking['total_amount']}. "
+            f"Amount: {format_currency(booking['total_amount'])}. "
             f"Thank you for booking with Eventia!"
         )
         
@@ -448,7 +472,7 @@ class SMSNotification:
         message = (
             f"Payment Confirmed for {event['title']}. "
             f"Booking ID: {booking['booking_id']}. "
-            f"Amount: ₹{booking['total_amount']}. "
+            f"Amount: {format_currency(booking['total_amount'])}. "
             f"Show your booking ID at the venue. Thank you!"
         )
         
@@ -0,0 +1,167 @@
+"""
+In-memory stand-in for the few Motor collection methods the controller
+tests exercise, for running them without a MongoDB server.
+
+Every call yields to the event loop once, like a network round-trip, so
+concurrent tasks interleave the way they would against a real server.
+"""
+import asyncio
+import copy
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+
+
+def _get(document: Dict[str, Any], path: str) -> Any:
+    value = document
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _compare(value: Any, other: Any, op) -> bool:
+    try:
+        return value is not None and op(value, other)
+    except TypeError:
+        return False
+
+
+def _matches_condition(value: Any, condition: Any) -> bool:
+    if isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+        for op, operand in condition.items():
+            if op == "$in" and value not in operand:
+                return False
+            if op == "$lt" and not _compare(value, operand, lambda a, b: a < b):
+                return False
+            if op == "$lte" and not _compare(value, operand, lambda a, b: a <= b):
+                return False
+            if op == "$gte" and not _compare(value, operand, lambda a, b: a >= b):
+                return False
+            if op == "$ne" and value == operand:
+                return False
+        return True
+    return value == condition
+
+
+def matches(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    """Evaluate the subset of the MongoDB query language used in tests"""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(matches(document, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(matches(document, sub) for sub in condition):
+                return False
+        elif not _matches_condition(_get(document, key), condition):
+            return False
+    return True
+
+
+def _project(document: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    document = copy.deepcopy(document)
+    if not projection:
+        return document
+    if not any(projection.values()):
+        return {k: v for k, v in document.items() if k not in projection}
+    return {k: v for k, v in document.items() if k == "_id" or k.split(".")[0] in {p.split(".")[0] for p in projection}}
+
+
+def _apply_update(document: Dict[str, Any], update: Dict[str, Any]) -> None:
+    for field, value in update.get("$set", {}).items():
+        document[field] = value
+    for field in update.get("$unset", {}):
+        document.pop(field, None)
+    for field, amount in update.get("$inc", {}).items():
+        document[field] = document.get(field, 0) + amount
+
+
+class FakeCursor:
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self._documents = documents
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key, direction=None):
+        keys = [(key, direction)] if isinstance(key, str) else key
+        for field, order in reversed(keys):
+            self._documents.sort(
+                key=lambda doc: (_get(doc, field) is not None, _get(doc, field)),
+                reverse=order == -1
+            )
+        return self
+
+    def skip(self, count: int):
+        self._skip = count
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def batch_size(self, count: int):
+        return self
+
+    async def to_list(self, length: Optional[int] = None):
+        await asyncio.sleep(0)
+        documents = self._documents[self._skip:]
+        if self._limit:
+            documents = documents[:self._limit]
+        return documents[:length] if length else documents
+
+
+class FakeCollection:
+    def __init__(self, documents: Optional[List[Dict[str, Any]]] = None):
+        self.documents: List[Dict[str, Any]] = []
+        for document in documents or []:
+            document = copy.deepcopy(document)
+            document.setdefault("_id", ObjectId())
+            self.documents.append(document)
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None):
+        return FakeCursor([
+            _project(document, projection) for document in self.documents if matches(document, query or {})
+        ])
+
+    async def find_one(self, query: Dict[str, Any], projection: Optional[Dict[str, Any]] = None):
+        await asyncio.sleep(0)
+        for document in self.documents:
+            if matches(document, query):
+                return _project(document, projection)
+        return None
+
+    async def count_documents(self, query: Dict[str, Any]) -> int:
+        await asyncio.sleep(0)
+        return sum(1 for document in self.documents if matches(document, query))
+
+    async def insert_one(self, document: Dict[str, Any]):
+        await asyncio.sleep(0)
+        document.setdefault("_id", ObjectId())
+        self.documents.append(copy.deepcopy(document))
+        return SimpleNamespace(inserted_id=document["_id"])
+
+    async def update_one(self, query: Dict[str, Any], update: Dict[str, Any]):
+        await asyncio.sleep(0)
+        for document in self.documents:
+            if matches(document, query):
+                _apply_update(document, update)
+                return SimpleNamespace(matched_count=1, modified_count=1)
+        return SimpleNamespace(matched_count=0, modified_count=0)
+
+    async def update_many(self, query: Dict[str, Any], update: Dict[str, Any]):
+        await asyncio.sleep(0)
+        matched = [document for document in self.documents if matches(document, query)]
+        for document in matched:
+            _apply_update(document, update)
+        return SimpleNamespace(matched_count=len(matched), modified_count=len(matched))
+
+    async def find_one_and_update(self, query, update, projection=None, return_document=False):
+        await asyncio.sleep(0)
+        for document in self.documents:
+            if matches(document, query):
+                before = _project(document, projection)
+                _apply_update(document, update)
+                return _project(document, projection) if return_document else before
+        return None
@@ -0,0 +1,43 @@
+"""
+Tests for booking state changes that must stop the unpaid-booking TTL
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from app.controllers.booking_controller import BookingController
+from app.schemas.bookings import BookingType, UTRSubmission
+from fake_mongo import FakeCollection
+
+
+@pytest.fixture
+def bookings_collection():
+    collection = FakeCollection([{
+        "booking_id": "BK-TEST",
+        "booking_type": BookingType.SEAT,
+        "status": "payment_pending",
+        "selected_seats": [{"seat_id": "seat-1"}, {"seat_id": "seat-2"}],
+        "expires_at": datetime.utcnow() + timedelta(minutes=30),
+    }])
+    with patch("app.controllers.booking_controller.get_collection", AsyncMock(return_value=collection)), \
+            patch("app.controllers.booking_controller.SeatController.batch_update_seats",
+                  AsyncMock(return_value={"updated_count": 2})):
+        yield collection
+
+
+@pytest.mark.asyncio
+async def test_confirmed_seat_booking_has_no_expiry(bookings_collection):
+    await BookingController.confirm_seat_reservation("BK-TEST")
+
+    booking = await bookings_collection.find_one({"booking_id": "BK-TEST"})
+    assert booking["seat_reservation_confirmed"] is True
+    assert "expires_at" not in booking
+
+
+@pytest.mark.asyncio
+async def test_payment_submission_clears_expiry(bookings_collection):
+    await BookingController.verify_payment(UTRSubmission(booking_id="BK-TEST", utr="123456789012"))
+
+    booking = await bookings_collection.find_one({"booking_id": "BK-TEST"})
+    assert booking["status"] == "pending_verification"
+    assert "expires_at" not in booking
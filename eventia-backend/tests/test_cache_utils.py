@@ -0,0 +1,33 @@
+from fastapi import Response
+from app.utils.cache import PUBLIC_CACHE_CONTROL, TTLCache, public_cache_control, set_public_cache
+
+
+def test_public_cache_control_defaults():
+    assert PUBLIC_CACHE_CONTROL == "public, max-age=30, stale-while-revalidate=60"
+
+def test_public_cache_control_custom():
+    assert public_cache_control(5, 10) == "public, max-age=5, stale-while-revalidate=10"
+
+def test_set_public_cache():
+    response = Response()
+    set_public_cache(response)
+    assert response.headers["Cache-Control"] == PUBLIC_CACHE_CONTROL
+
+def test_ttl_cache_returns_copies():
+    cache = TTLCache(ttl=60)
+    value = {"code": "SAVE10", "uses": []}
+    cache.set("SAVE10", value)
+    value["uses"].append(1)
+    cached = cache.get("SAVE10")
+    cached["uses"].append(2)
+    assert cache.get("SAVE10") == {"code": "SAVE10", "uses": []}
+
+def test_ttl_cache_expiry_and_eviction():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("expired", 1, ttl=0)
+    assert cache.get("expired") is None
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2 and cache.get("c") == 3
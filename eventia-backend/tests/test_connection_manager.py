@@ -0,0 +1,66 @@
+"""
+Tests for coalescing of WebSocket seat updates
+"""
+import json
+import pytest
+
+from app.websockets.connection_manager import ConnectionManager
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, payload):
+        self.frames.append(json.loads(payload))
+
+
+@pytest.fixture
+def manager_and_socket():
+    manager = ConnectionManager()
+    websocket = RecordingWebSocket()
+    manager.active_connections["stadium-1"] = {websocket}
+    return manager, websocket
+
+
+@pytest.mark.asyncio
+async def test_single_update_is_sent_unwrapped(manager_and_socket):
+    manager, websocket = manager_and_socket
+
+    manager.queue_stadium_update("stadium-1", {"type": "seat_reserved", "data": {"id": "s1"}})
+    await manager._flusher
+
+    assert websocket.frames == [{"type": "seat_reserved", "data": {"id": "s1"}}]
+
+
+@pytest.mark.asyncio
+async def test_burst_is_sent_as_one_batch_frame(manager_and_socket):
+    manager, websocket = manager_and_socket
+    updates = [{"type": "seat_reserved", "data": {"id": f"s{i}"}} for i in range(3)]
+
+    for update in updates:
+        manager.queue_stadium_update("stadium-1", update)
+    await manager._flusher
+
+    assert websocket.frames == [{"type": "batch", "updates": updates}]
+
+
+@pytest.mark.asyncio
+async def test_flusher_exits_once_buffers_drain(manager_and_socket):
+    manager, websocket = manager_and_socket
+
+    manager.queue_stadium_update("stadium-1", {"type": "seat_reserved", "data": {"id": "s1"}})
+    first_flusher = manager._flusher
+    await first_flusher
+    assert first_flusher.done()
+    assert manager._buffers == {}
+
+    # A later update starts a fresh flusher rather than joining the old batch
+    manager.queue_stadium_update("stadium-1", {"type": "seat_updated", "data": {"id": "s2"}})
+    assert manager._flusher is not first_flusher
+    await manager._flusher
+
+    assert websocket.frames == [
+        {"type": "seat_reserved", "data": {"id": "s1"}},
+        {"type": "seat_updated", "data": {"id": "s2"}},
+    ]
@@ -0,0 +1,42 @@
+"""
+Tests for the per-worker discount code cache
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.models import discount as discount_model
+from fake_mongo import FakeCollection
+
+
+@pytest.fixture
+def discounts_collection():
+    collection = FakeCollection([{"id": "disc-1", "code": "SAVE10", "is_active": True}])
+    discount_model._discount_cache.clear()
+    with patch("app.models.discount.get_collection", AsyncMock(return_value=collection)):
+        yield collection
+    discount_model._discount_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_found_code_is_cached(discounts_collection):
+    assert (await discount_model._get_discount_by_code_cached("SAVE10"))["id"] == "disc-1"
+
+    # Served from the cache even once the document is gone
+    discounts_collection.documents.clear()
+    assert (await discount_model._get_discount_by_code_cached("SAVE10"))["id"] == "disc-1"
+
+
+@pytest.mark.asyncio
+async def test_unknown_code_is_not_cached(discounts_collection):
+    assert await discount_model._get_discount_by_code_cached("NEW20") is None
+
+    # Created elsewhere (e.g. through another worker) right after the miss
+    discounts_collection.documents.append({"id": "disc-2", "code": "NEW20"})
+    assert (await discount_model._get_discount_by_code_cached("NEW20"))["id"] == "disc-2"
+
+
+@pytest.mark.asyncio
+async def test_create_discount_requires_code(discounts_collection):
+    with pytest.raises(ValueError):
+        await discount_model.create_discount({"description": "No code"})
+    assert len(discounts_collection.documents) == 1
@@ -0,0 +1,103 @@
+"""
+Tests for keyset pagination of discounts
+"""
+import pytest
+from bson import ObjectId
+from unittest.mock import AsyncMock, patch
+
+from app.models.discount import _decode_discount_cursor, _encode_discount_cursor, get_discounts
+from fake_mongo import FakeCollection
+
+
+@pytest.fixture
+def discounts_collection():
+    # Five discounts sharing one created_at, plus two older documents that
+    # predate the created_at field
+    documents = [
+        {"_id": ObjectId(), "code": f"TIE{i}", "is_active": True, "created_at": "2025-04-18T20:02:57"}
+        for i in range(5)
+    ] + [
+        {"_id": ObjectId(), "code": f"LEGACY{i}", "is_active": True}
+        for i in range(2)
+    ]
+    collection = FakeCollection(documents)
+    with patch("app.models.discount.get_collection", AsyncMock(return_value=collection)):
+        yield collection
+
+
+async def _all_pages(limit, **filters):
+    codes, pages, after = [], 0, None
+    while True:
+        page = await get_discounts(limit=limit, after=after, **filters)
+        codes.extend(discount["code"] for discount in page["discounts"])
+        pages += 1
+        after = page["next_cursor"]
+        if after is None:
+            return codes, pages, page
+
+
+def test_cursor_round_trip():
+    discount_id = ObjectId()
+    cursor = _encode_discount_cursor(discount_id)
+    assert isinstance(cursor, str)
+    assert cursor.replace("-", "").replace("_", "").isalnum()
+    assert _decode_discount_cursor(cursor) == discount_id
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "!!!", "AAAA", "W251bGxd"])
+def test_malformed_cursor_rejected(cursor):
+    with pytest.raises(ValueError):
+        _decode_discount_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_raises_before_query(discounts_collection):
+    with pytest.raises(ValueError):
+        await get_discounts(after="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_pages_cover_created_at_ties_and_missing_created_at(discounts_collection):
+    codes, pages, _ = await _all_pages(limit=2)
+
+    assert sorted(codes) == sorted(document["code"] for document in discounts_collection.documents)
+    assert len(codes) == len(set(codes))
+    assert pages == 4
+
+
+@pytest.mark.asyncio
+async def test_pages_are_newest_first(discounts_collection):
+    codes, _, _ = await _all_pages(limit=3)
+
+    newest_first = sorted(discounts_collection.documents, key=lambda document: document["_id"], reverse=True)
+    assert codes == [document["code"] for document in newest_first]
+
+
+@pytest.mark.asyncio
+async def test_last_page(discounts_collection):
+    page = await get_discounts(limit=10)
+    assert len(page["discounts"]) == 7
+    assert page["total"] == 7
+    assert page["next_cursor"] is None
+
+    # A full final page still hands out a cursor; following it yields an
+    # empty page that ends the iteration
+    _, pages, last = await _all_pages(limit=7)
+    assert pages == 2
+    assert last["discounts"] == []
+
+
+@pytest.mark.asyncio
+async def test_cursor_respects_filters(discounts_collection):
+    discounts_collection.documents[0]["is_active"] = False
+
+    codes, _, last = await _all_pages(limit=2, is_active=True)
+    assert len(codes) == 6
+    assert last["total"] == 6
+
+
+@pytest.mark.asyncio
+async def test_skip_is_deprecated(discounts_collection):
+    with pytest.deprecated_call():
+        page = await get_discounts(skip=5, limit=10)
+    assert len(page["discounts"]) == 2
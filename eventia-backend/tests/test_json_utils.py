@@ -0,0 +1,74 @@
+import json
+import warnings
+import orjson
+import pytest
+from datetime import datetime
+from bson import ObjectId
+from pydantic import BaseModel
+from app.utils.json_utils import CustomJSONEncoder, ORJSONResponse, json_serializer, orjson_dumps, serialize_dict, stringify_object_ids
+
+
+class SampleModel(BaseModel):
+    name: str
+    quantity: int
+
+
+def test_orjson_dumps_handles_objectid_and_datetime():
+    oid = ObjectId()
+    payload = {"_id": oid, "created_at": datetime(2025, 5, 1, 14, 30)}
+    result = orjson.loads(orjson_dumps(payload))
+    assert result["_id"] == str(oid)
+    assert result["created_at"] == "2025-05-01T14:30:00"
+
+def test_orjson_dumps_handles_pydantic_models():
+    payload = {"ticket": SampleModel(name="VIP", quantity=2)}
+    result = orjson.loads(orjson_dumps(payload))
+    assert result == {"ticket": {"name": "VIP", "quantity": 2}}
+
+def test_pydantic_models_serialize_without_deprecation_warnings():
+    class SeatModel(BaseModel):
+        row: str
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert orjson.loads(orjson_dumps({"seat": SeatModel(row="A")})) == {"seat": {"row": "A"}}
+        assert json.loads(json.dumps({"seat": SeatModel(row="B")}, cls=CustomJSONEncoder)) == {"seat": {"row": "B"}}
+
+def test_serialize_dict_converts_nested_values():
+    oid = ObjectId()
+    data = {
+        "_id": oid,
+        "teams": [{"team_id": oid, "joined": datetime(2025, 4, 25, 18, 0)}],
+        "venue": {"name": "Wankhede", "opened": datetime(1974, 1, 23)},
+    }
+    result = serialize_dict(data)
+    assert result["_id"] == str(oid)
+    assert result["teams"][0] == {"team_id": str(oid), "joined": "2025-04-25T18:00:00"}
+    assert result["venue"]["opened"] == "1974-01-23T00:00:00"
+
+def test_serialize_dict_none():
+    assert serialize_dict(None) is None
+
+def test_stringify_object_ids_keeps_datetimes():
+    oid = ObjectId()
+    start = datetime(2025, 4, 25, 18, 0)
+    doc = {"_id": oid, "team_ids": [oid, oid], "start_date": start, "name": "Final"}
+    result = stringify_object_ids(doc)
+    assert result is doc
+    assert result == {"_id": str(oid), "team_ids": [str(oid), str(oid)], "start_date": start, "name": "Final"}
+
+def test_json_serializer_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        json_serializer(object())
+
+def test_custom_json_encoder_uses_cached_serializers():
+    oid = ObjectId()
+    first = json.dumps({"_id": oid}, cls=CustomJSONEncoder)
+    second = json.dumps({"_id": oid}, cls=CustomJSONEncoder)
+    assert first == second == f'{{"_id": "{oid}"}}'
+
+def test_orjson_response_renders_object_id():
+    oid = ObjectId()
+    response = ORJSONResponse(content={"id": oid})
+    assert response.body == b'{"id":"' + str(oid).encode() + b'"}'
+    assert response.media_type == "application/json"
@@ -0,0 +1,78 @@
+"""
+Tests for concurrent seat reservations
+"""
+import asyncio
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException, status
+from unittest.mock import AsyncMock, patch
+
+from app.controllers.seat_controller import SeatController
+from app.models.seat import SeatStatus
+from app.schemas.seat import SeatReservationRequest
+from fake_mongo import FakeCollection
+
+
+@pytest.fixture
+def seats_collection():
+    collection = FakeCollection([
+        {"_id": ObjectId(), "row": "A", "number": number, "status": SeatStatus.AVAILABLE, "user_id": None}
+        for number in range(1, 5)
+    ])
+    with patch("app.controllers.seat_controller.get_collection", AsyncMock(return_value=collection)), \
+            patch.object(SeatController, "_release_seats_after_timeout", AsyncMock()):
+        yield collection
+
+
+def _seat_ids(collection, numbers):
+    return [str(seat["_id"]) for seat in collection.documents if seat["number"] in numbers]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_reservations_one_wins(seats_collection):
+    first = SeatReservationRequest(seat_ids=_seat_ids(seats_collection, {1, 2, 3}), user_id="user-1")
+    second = SeatReservationRequest(seat_ids=_seat_ids(seats_collection, {3, 4}), user_id="user-2")
+
+    results = await asyncio.gather(
+        SeatController.reserve_seats(first),
+        SeatController.reserve_seats(second),
+        return_exceptions=True
+    )
+
+    # Both requests pass the availability read before either writes, so the
+    # conflict is caught by the conditional update
+    successes = [result for result in results if isinstance(result, dict)]
+    conflicts = [result for result in results if isinstance(result, HTTPException)]
+    assert len(successes) == 1
+    assert len(conflicts) == 1
+    assert conflicts[0].status_code == status.HTTP_409_CONFLICT
+    assert conflicts[0].detail == "One or more seats were reserved by another user"
+
+    # The winner keeps every seat it reserved
+    winner = first if results[0] is successes[0] else second
+    for seat in seats_collection.documents:
+        if str(seat["_id"]) in winner.seat_ids:
+            assert seat["status"] == SeatStatus.RESERVED
+            assert seat["user_id"] == winner.user_id
+
+    # The loser's partial reservation is rolled back
+    loser_only = set(first.seat_ids) ^ set(second.seat_ids)
+    for seat in seats_collection.documents:
+        if str(seat["_id"]) in loser_only - set(winner.seat_ids):
+            assert seat["status"] == SeatStatus.AVAILABLE
+            assert seat["user_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_reserving_taken_seats_conflicts(seats_collection):
+    await SeatController.reserve_seats(
+        SeatReservationRequest(seat_ids=_seat_ids(seats_collection, {1, 2}), user_id="user-1")
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await SeatController.reserve_seats(
+            SeatReservationRequest(seat_ids=_seat_ids(seats_collection, {2, 3}), user_id="user-2")
+        )
+
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+    assert [seat["user_id"] for seat in seats_collection.documents] == ["user-1", "user-1", None, None]
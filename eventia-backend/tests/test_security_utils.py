@@ -0,0 +1,26 @@
+import re
+from app.config import settings
+from app.utils.security import generate_random_token, generate_unique_id, verify_admin_token
+
+
+def test_generate_random_token_length():
+    token = generate_random_token(24)
+    assert len(token) == 24
+    assert re.fullmatch(r"[A-Za-z0-9_-]+", token)
+
+def test_generate_unique_id_format():
+    unique_id = generate_unique_id("disc")
+    assert re.fullmatch(r"disc-\d{8}-[0-9a-f]{8}", unique_id)
+
+def test_generate_unique_id_odd_length():
+    unique_id = generate_unique_id("BK", length=5)
+    assert len(unique_id.split("-")[-1]) == 5
+
+def test_generate_unique_id_is_unique():
+    ids = {generate_unique_id("BK") for _ in range(100)}
+    assert len(ids) == 100
+
+def test_verify_admin_token():
+    assert verify_admin_token(settings.ADMIN_TOKEN)
+    assert not verify_admin_token(settings.ADMIN_TOKEN + "x")
+    assert not verify_admin_token("")